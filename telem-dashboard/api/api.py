@@ -7,13 +7,56 @@ Both a Backend and Frontend are required, so I am focusing on functionality over
 """
 
 import sqlite3
-from flask import Flask, request, jsonify
-from datetime import datetime
+from flask import Flask, request, g
+from flask.json.provider import JSONProvider
+from datetime import date
+import math
+import operator
 import os
+import re
+
+import orjson
+from whitenoise import WhiteNoise
 
 import util
 
-app = Flask(__name__, static_folder='../dist', static_url_path='/')
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    The handlers build their responses with `json_response`, this covers everything else that goes through Flask's
+    JSON support, like `jsonify` and `request.get_json`, so none of it falls back to the stdlib encoder and decoder.
+    Keys are sorted like Flask's default provider, through `sort_keys` or a `sort_keys` argument to `dumps`.
+    Other stdlib keyword arguments, such as `indent`, are ignored.
+    """
+
+    # Same default as Flask's provider, so jsonify output keeps its key order
+    sort_keys = True
+
+    def dumps(self, obj, **kwargs):
+        """Serialize `obj` to a JSON string."""
+        option = orjson.OPT_SORT_KEYS if kwargs.get('sort_keys', self.sort_keys) else 0
+        return orjson.dumps(obj, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize JSON from a string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response from the bytes orjson produces, skipping the decode and re-encode of `dumps`."""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        return self._app.response_class(orjson.dumps(obj, option=option), mimetype='application/json')
+
+
+# Static files are served by WhiteNoise below, not by a Flask route
+app = Flask(__name__, static_folder=None)
+app.json = OrjsonProvider(app)
+# Match '/telemetry/' and '/telemetry' to the same rule when the URL map is built instead of redirecting per request.
+app.url_map.strict_slashes = False
+
+# Built React frontend
+DIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'dist')
 
 # Database setup
 if os.environ.get('DATABASE_LOCATION'):
@@ -21,96 +64,345 @@ if os.environ.get('DATABASE_LOCATION'):
 else:
     DATABASE = 'telemetry.db'
 
-# Initialize database on startup
+# Rows written per transaction by the bulk endpoint, this bounds how long one request holds the write lock
+BULK_CHUNK_SIZE = 5000
+
+# Fields every telemetry entry must have, in insert order. The itemgetter extracts them all in a single C call.
+REQUIRED_FIELDS = ('satelliteId', 'timestamp', 'altitude', 'velocity', 'status')
+get_required_fields = operator.itemgetter(*REQUIRED_FIELDS)
 
-if not os.path.exists(DATABASE):
-    util.init_db()
+# ISO 8601 date with an optional time (seconds and fraction optional) and an optional Z or +/-HH[:MM] offset
+# Every optional part starts with a different literal (T or space, colon, dot or comma, Z or a sign), so a failed match
+# has nothing to backtrack into and gives up in linear time without needing atomic groups.
+ISO_8601 = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,]\d+)?)?'
+    r'(?:Z|[+-](\d{2})(?::?(\d{2}))?)?)?',
+    re.ASCII
+)
+
+# Every telemetry column in table order, used as the keys when a tuple row is turned into a dict
+TELEMETRY_COLUMNS = ('id',) + REQUIRED_FIELDS
+
+# Allowed values, frozensets give a hashed lookup without building a list on every call
+VALID_STATUS = frozenset(('healthy', 'critical'))
+VALID_COLUMNS = frozenset(TELEMETRY_COLUMNS)
+VALID_ORDER = frozenset(('asc', 'desc'))
+
+# Columns compared as numbers when they are used as a keyset pagination cursor
+NUMERIC_COLUMNS = ('altitude', 'velocity')
+
+# Hot statements are kept as constants so every request passes sqlite3 the exact same text
+# and hits the connection's prepared statement cache instead of re-parsing the SQL.
+SQL_GET_BY_ID = f'SELECT {", ".join(TELEMETRY_COLUMNS)} FROM telemetry WHERE id = ?'
+SQL_DELETE = 'DELETE FROM telemetry WHERE id = ? RETURNING id'
+SQL_DELETE_NO_RETURNING = 'DELETE FROM telemetry WHERE id = ?'
+SQL_TOTAL = "SELECT value AS total FROM meta WHERE key = 'telemetry_count'"
+SQL_INSERT = '''
+    INSERT INTO telemetry (satelliteId, timestamp, altitude, velocity, status)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+# RETURNING needs SQLite 3.35. Older libraries run a plain DELETE and check the affected row count instead,
+# which is still a single statement per request.
+DELETE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+if not DELETE_RETURNING:
+    app.logger.warning('SQLite %s has no RETURNING support, DELETE falls back to the affected row count', sqlite3.sqlite_version)
+
+# Single POST inserts are group-committed by one background thread per process
+WRITER = util.BatchWriter(SQL_INSERT)
+
+# Initialize database on startup
+# init_db is idempotent, so running it against an existing database also adds any newer indexes and triggers
+util.init_db(DATABASE)
 
 # Now for the functionality
 
-@app.before_request
-def clear_trailing():
-    """Redirect paths with trailing slashes to non-trailing slash versions because Flask defaults to strict slashes and I want to avoid 400s."""
-    from flask import redirect, request
+def json_response(data, status=200):
+    """
+    Build a JSON response with orjson.
+    
+    This replaces `jsonify`, which goes through the stdlib json encoder. orjson encodes straight to bytes in C,
+    which matters most for the paginated GET response of up to 100 rows.
+    """
+    return app.response_class(orjson.dumps(data), status=status, mimetype='application/json')
+
+def read_json():
+    """
+    Parse the request body with orjson.
+    
+    Returns `(data, error)` like `validate_telemetry`. A body that is not JSON gets a JSON error message back
+    instead of the HTML 400/415 page `request.get_json` would raise. The raw body is not cached on the request
+    since nothing reads it again.
+    """
+    if not request.is_json:
+        return None, 'Request body must be JSON with a Content-Type of application/json.'
+    try:
+        return orjson.loads(request.get_data(cache=False)), None
+    except orjson.JSONDecodeError:
+        return None, 'Request body is not valid JSON.'
+
+def get_db():
+    """
+    Get the database connection for the current request.
+    
+    The connection is taken from the database's pool on first use and cached on `g`, so a request holds at most
+    one connection no matter how many queries it runs. `close_db` hands it back when the app context tears down.
+    """
+    if 'db' not in g:
+        g.db_pool = util.get_pool(DATABASE)
+        g.db = g.db_pool.acquire()
+    return g.db
 
-    rp = request.path 
-    if rp != '/' and rp.endswith('/'):
-        return redirect(rp[:-1])
+@app.teardown_appcontext
+def close_db(exception):
+    """Return the request's database connection to its pool, if one was taken."""
+    db = g.pop('db', None)
+    if db is not None:
+        g.pop('db_pool').release(db)
+
+def telemetry_dicts(rows):
+    """
+    Turn tuple rows in `TELEMETRY_COLUMNS` order into the dicts sent back to clients.
+    
+    A dict display indexing the tuple builds each dict in one step, where `dict(zip(...))` makes a zip iterator
+    and a pair tuple per column first. Extra trailing columns are ignored.
+    """
+    return [
+        {'id': row[0], 'satelliteId': row[1], 'timestamp': row[2], 'altitude': row[3], 'velocity': row[4], 'status': row[5]}
+        for row in rows
+    ]
+
+def telemetry_column_lists(rows):
+    """
+    Turn tuple rows in `TELEMETRY_COLUMNS` order into one array per column, for `format=columnar` responses.
+    
+    Transposing with `zip` allocates one tuple per column instead of one dict per row, and orjson writes
+    tuples straight out as JSON arrays.
+    """
+    columns = zip(*rows) if rows else ((),) * len(TELEMETRY_COLUMNS)
+    return dict(zip(TELEMETRY_COLUMNS, columns))
 
 def validate_iso(timestamp_str):
-    """Validate that a timestamp is in ISO 8601 format."""
+    """
+    Validate that a timestamp is in ISO 8601 format.
+    
+    The precompiled `ISO_8601` pattern checks the shape and captures the fields, then only the
+    calendar date is handed to `date` to catch things like February 30th. This avoids the string copy
+    for the `Z` replace and the full `datetime.fromisoformat` parse when all we need is a boolean.
+    """
+    # Anything that does not open with a four digit year is rejected before starting the regex engine
+    if not isinstance(timestamp_str, str) or not timestamp_str[:4].isdigit():
+        return False
+    
+    match = ISO_8601.fullmatch(timestamp_str)
+    if not match:
+        return False
+    
+    year, month, day, hour, minute, second, offset_hour, offset_minute = (int(group or 0) for group in match.groups())
     try:
-        datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        return True
-    except (ValueError, AttributeError):
+        date(year, month, day)
+    except ValueError:
         return False
+    
+    return hour < 24 and minute < 60 and second < 60 and offset_hour < 24 and offset_minute < 60
 
 def validate_status(status):
     """Validate the status
     """
-    return status in ['healthy', 'critical']
+    # JSON can hand us unhashable values like lists, which a set lookup would raise on
+    return isinstance(status, str) and status in VALID_STATUS
+
+def validate_telemetry(data):
+    """
+    Validate a single telemetry entry.
+    
+    Returns a tuple of (row, error). On success, row is ready to insert in
+    (satelliteId, timestamp, altitude, velocity, status) order and error is None.
+    On failure, row is None and error is the message to send back to the client.
+    """
+    if not isinstance(data, dict):
+        return None, 'Telemetry entry must be a JSON object.'
+    
+    # Pull every required field out in one call, only walk them one by one to report which is missing
+    try:
+        satellite_id, timestamp, altitude, velocity, status = get_required_fields(data)
+    except KeyError:
+        for field in REQUIRED_FIELDS:
+            if field not in data:
+                return None, f'Missing required field: {field}'
+    
+    # satelliteId goes straight into a NOT NULL TEXT column, so anything but a non-empty string is rejected here
+    if not isinstance(satellite_id, str) or not satellite_id:
+        return None, 'satelliteId must be a non-empty string.'
+    
+    # Validate timestamp format
+    if not validate_iso(timestamp):
+        return None, 'Invalid timestamp format. Must be ISO 8601.'
+    
+    # Validate status, the same check as validate_status inlined to save a function call per entry on the POST path
+    if not (isinstance(status, str) and status in VALID_STATUS):
+        return None, 'Status must be either "healthy" or "critical".'
+    
+    # Validate numeric fields
+    try:
+        altitude = float(altitude)
+        velocity = float(velocity)
+    except (ValueError, TypeError):
+        return None, 'Altitude and velocity must be numeric.'
+    
+    # float() also parses "nan" and "inf". NaN is stored as NULL, which the NOT NULL columns reject,
+    # and orjson writes either one back out as null, so neither is a usable reading.
+    if not (math.isfinite(altitude) and math.isfinite(velocity)):
+        return None, 'Altitude and velocity must be finite numbers.'
+    
+    if altitude < 0 or velocity < 0:
+        return None, 'Altitude and velocity must be non-negative.'
+    
+    return (satellite_id, timestamp, altitude, velocity, status), None
+
+def build_list_query(sort_by, sort_order, has_satellite, has_status, keyset):
+    """
+    Assemble the page query for GET /telemetry.
+    
+    This only runs at import to fill `LIST_QUERIES`. Requests look their query up by key instead of formatting SQL,
+    so each variant is always the same string and stays in sqlite3's prepared statement cache.
+    """
+    query = f'SELECT {", ".join(TELEMETRY_COLUMNS)} FROM telemetry WHERE 1=1'
+    if has_satellite:
+        query += ' AND satelliteId = ?'
+    if has_status:
+        query += ' AND status = ?'
+    
+    comparison = '>' if sort_order == 'asc' else '<'
+    if keyset and sort_by == 'id':
+        query += f' AND id {comparison} ?'
+    elif keyset:
+        query += f' AND ({sort_by}, id) {comparison} (?, ?)'
+    
+    # id breaks ties so pages never overlap or skip rows
+    if sort_by == 'id':
+        query += f' ORDER BY id {sort_order}'
+    else:
+        query += f' ORDER BY {sort_by} {sort_order}, id {sort_order}'
+    
+    query += ' LIMIT ?' if keyset else ' LIMIT ? OFFSET ?'
+    return query
+
+# Every (sort_by, sort_order, has_satellite, has_status, keyset) combination, built once
+LIST_QUERIES = {
+    (sort_by, sort_order, has_satellite, has_status, keyset): build_list_query(sort_by, sort_order, has_satellite, has_status, keyset)
+    for sort_by in VALID_COLUMNS
+    for sort_order in VALID_ORDER
+    for has_satellite in (False, True)
+    for has_status in (False, True)
+    for keyset in (False, True)
+}
+
+# Filtered counts keyed by (has_satellite, has_status)
+COUNT_QUERIES = {
+    (True, False): 'SELECT COUNT(*) AS total FROM telemetry WHERE satelliteId = ?',
+    (False, True): 'SELECT COUNT(*) AS total FROM telemetry WHERE status = ?',
+    (True, True): 'SELECT COUNT(*) AS total FROM telemetry WHERE satelliteId = ? AND status = ?',
+}
 
 @app.route('/telemetry', methods=['GET'])
 def get_telemetry():
-    """Retrieve telemetry data with optional filtering, sorting, and pagination."""
-    db = util.get_db(DATABASE)
+    """
+    Retrieve telemetry data with optional filtering, sorting, and pagination.
+    
+    Pages can be requested by number with `page`, or by cursor with `after_id` (plus `after_value`,
+    the sort column value of the last row seen, when sorting by anything other than id).
+    `format=columnar` returns `data` as one array per column instead of one object per row.
+    """
+    db = get_db()
     cursor = db.cursor()
+    # Rows are turned into dicts by telemetry_dicts below, so plain tuples are enough and skip building a sqlite3.Row each
+    cursor.row_factory = None
     
     # Get query parameters for filtering
-    satellite_id = request.args.get('satelliteId')
-    status = request.args.get('status')
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
-    sort_by = request.args.get('sort_by', 'id')
-    sort_order = request.args.get('sort_order', 'asc')
+    # request is a context-local proxy, so resolve the args once instead of on every lookup
+    args = request.args
+    satellite_id = args.get('satelliteId')
+    status = args.get('status')
+    page = args.get('page', 1, type=int)
+    per_page = args.get('per_page', 20, type=int)
+    sort_by = args.get('sort_by', 'id')
+    sort_order = args.get('sort_order', 'asc').lower()
     
     # Ensure valid pagination parameters
     page = max(1, page)
     per_page = max(1, min(per_page, 100))  # Cap at 100 items per page
     
-    # Validate sort parameters to prevent SQL injection
-    valid_columns = ['id', 'satelliteId', 'timestamp', 'altitude', 'velocity', 'status']
-    if sort_by not in valid_columns:
+    # Validate sort parameters to prevent SQL injection. Anything unknown falls back to the default,
+    # and the whitelisted values are what key LIST_QUERIES, so no SQL is ever built per request.
+    if sort_by not in VALID_COLUMNS:
         sort_by = 'id'
     
-    if sort_order.lower() not in ['asc', 'desc']:
+    if sort_order not in VALID_ORDER:
         sort_order = 'asc'
     
-    # Build the base query
-    query = 'SELECT * FROM telemetry WHERE 1=1'
-    count_query = 'SELECT COUNT(*) as total FROM telemetry WHERE 1=1'
+    # Filter parameters are shared by the count and the page query
     params = []
-    
     if satellite_id:
-        query += ' AND satelliteId = ?'
-        count_query += ' AND satelliteId = ?'
         params.append(satellite_id)
-    
     if status:
-        query += ' AND status = ?'
-        count_query += ' AND status = ?'
         params.append(status)
+    filters = (bool(satellite_id), bool(status))
     
-    # Get total count
-    cursor.execute(count_query, params)
-    total = cursor.fetchone()['total']
+    # Keyset pagination: with after_id (and after_value when not sorting by id) the query seeks
+    # straight past the last row the client saw, so deep pages cost the same as the first one.
+    # Without it we fall back to LIMIT/OFFSET, which has to read and discard every skipped row.
+    after_id = args.get('after_id')
+    keyset = after_id is not None
+    if keyset:
+        # A bad cursor is an error rather than a silent fall back to the first page
+        try:
+            after_id = int(after_id)
+        except ValueError:
+            return json_response({'error': 'after_id must be an integer.'}, 400)
+        if sort_by == 'id':
+            page_params = [after_id, per_page]
+        else:
+            after_value = args.get('after_value')
+            if after_value is None:
+                return json_response({'error': 'after_value is required with after_id when not sorting by id.'}, 400)
+            if sort_by in NUMERIC_COLUMNS:
+                try:
+                    after_value = float(after_value)
+                except ValueError:
+                    return json_response({'error': f'after_value must be numeric when sorting by {sort_by}.'}, 400)
+            page_params = [after_value, after_id, per_page]
+    else:
+        page_params = [per_page, (page - 1) * per_page]
     
-    # Add sorting
-    query += f' ORDER BY {sort_by} {sort_order}'
+    # Get total count. Unfiltered requests read the trigger-maintained count instead of scanning,
+    # filtered ones count just the matching rows through the filter indexes.
+    # The count stays a separate query: a window COUNT(*) in the page query would make SQLite read and sort
+    # every matching row before applying LIMIT, losing the index-ordered early stop.
+    if not any(filters):
+        cursor.execute(SQL_TOTAL)
+    else:
+        cursor.execute(COUNT_QUERIES[filters], params)
+    total = cursor.fetchone()[0]
     
-    # Calculate pagination
-    offset = (page - 1) * per_page
-    query += ' LIMIT ? OFFSET ?'
-    params.extend([per_page, offset])
+    if total == 0:
+        # Nothing matches, so skip the page query entirely
+        rows = []
+    else:
+        query = LIST_QUERIES[(sort_by, sort_order, *filters, keyset)]
+        cursor.execute(query, params + page_params)
+        rows = cursor.fetchall()
     
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    db.close()
+    if args.get('format') == 'columnar':
+        data = telemetry_column_lists(rows)
+    else:
+        data = telemetry_dicts(rows)
     
     total_pages = (total + per_page - 1) // per_page
     
-    return jsonify({
-        'data': [dict(row) for row in rows],
+    return json_response({
+        'data': data,
         'pagination': {
             'page': page,
             'per_page': per_page,
@@ -126,95 +418,111 @@ def get_telemetry():
 @app.route('/telemetry/<int:entry_id>', methods=['GET'])
 def get_telemetry_by_id(entry_id):
     """Retrieve a specific telemetry entry by ID."""
-    db = util.get_db(DATABASE)
+    db = get_db()
     cursor = db.cursor()
+    # Plain tuple row, the keys come from telemetry_dicts rather than a sqlite3.Row lookup
+    cursor.row_factory = None
     
-    cursor.execute('SELECT * FROM telemetry WHERE id = ?', (entry_id,))
+    cursor.execute(SQL_GET_BY_ID, (entry_id,))
     row = cursor.fetchone()
-    db.close()
     
     if not row:
-        return jsonify({'error': 'Telemetry entry not found'}), 404
+        return json_response({'error': 'Telemetry entry not found'}, 404)
     
-    return jsonify(dict(row))
+    return json_response(telemetry_dicts((row,))[0])
 
 @app.route('/telemetry', methods=['POST'])
 def add_telemetry():
     """Add a new telemetry entry."""
-    data = request.get_json()
+    data, error = read_json()
+    if error:
+        return json_response({'error': error}, 400)
     
-    # Validate required fields are present
-    required_fields = ['satelliteId', 'timestamp', 'altitude', 'velocity', 'status']
-    for field in required_fields:
-        if field not in data:
-            return jsonify({'error': f'Missing required field: {field}'}), 400
+    row, error = validate_telemetry(data)
+    if error:
+        return json_response({'error': error}, 400)
     
-    # Validate timestamp format
-    if not validate_iso(data['timestamp']):
-        return jsonify({'error': 'Invalid timestamp format. Must be ISO 8601.'}), 400
-    
-    # Validate status
-    if not validate_status(data['status']):
-        return jsonify({'error': 'Status must be either "healthy" or "critical".'}), 400
+    # Now that everything is validated, hand the row to the writer thread to commit alongside any concurrent POSTs
+    new_id = WRITER.insert(DATABASE, row)
     
-    # Validate numeric fields
-    try:
-        altitude = float(data['altitude'])
-        velocity = float(data['velocity'])
-    except (ValueError, TypeError):
-        return jsonify({'error': 'Altitude and velocity must be numeric.'}), 400
+    # return 201 for successfully created
+    return json_response({'id': new_id, 'message': 'Telemetry entry added'}, 201)
+
+
+@app.route('/telemetry/bulk', methods=['POST'])
+def add_telemetry_bulk():
+    """
+    Add many telemetry entries in one request.
     
-    if altitude < 0 or velocity < 0:
-        return jsonify({'error': 'Altitude and velocity must be non-negative.'}), 400
+    Every entry is validated before anything is written, so one bad entry rejects the whole batch.
+    Rows are inserted with `executemany`, one transaction per `BULK_CHUNK_SIZE` rows,
+    so the commit cost is paid once per chunk instead of once per entry.
+    """
+    data, error = read_json()
+    if error:
+        return json_response({'error': error}, 400)
     
-    # Now that everything is validated, insert into the database
-    db = util.get_db(DATABASE)
-    cursor = db.cursor()
+    if not isinstance(data, list) or not data:
+        return json_response({'error': 'Request body must be a non-empty JSON array of telemetry entries.'}, 400)
     
-    cursor.execute('''
-        INSERT INTO telemetry (satelliteId, timestamp, altitude, velocity, status)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (data['satelliteId'], data['timestamp'], altitude, velocity, data['status']))
+    rows = []
+    for index, entry in enumerate(data):
+        row, error = validate_telemetry(entry)
+        if error:
+            return json_response({'error': f'Entry {index}: {error}'}, 400)
+        rows.append(row)
     
-    db.commit()
-    new_id = cursor.lastrowid
-    db.close()
+    db = get_db()
+    ids = []
+    for start in range(0, len(rows), BULK_CHUNK_SIZE):
+        chunk = rows[start:start + BULK_CHUNK_SIZE]
+        with util.transaction(db):
+            db.executemany(SQL_INSERT, chunk)
+            last_id = db.execute(util.SQL_LAST_INSERT_ID).fetchone()[0]
+        # AUTOINCREMENT hands out sequential ids while this transaction holds the write lock
+        ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
     
-    # return 201 for successfully created
-    return jsonify({'id': new_id, 'message': 'Telemetry entry added'}), 201
+    return json_response({'ids': ids, 'message': f'{len(ids)} telemetry entries added'}, 201)
+
+
+@app.route('/telemetry/pool-health', methods=['GET'])
+def get_pool_health():
+    """Report how many database connections are checked out and how many are idle in the pool."""
+    return json_response(util.get_pool(DATABASE).stats())
 
 
 @app.route('/telemetry/<int:entry_id>', methods=['DELETE'])
 def delete_telemetry(entry_id):
     """Delete a specific telemetry entry by ID."""
-    db = util.get_db(DATABASE)
+    db = get_db()
     cursor = db.cursor()
     
-    cursor.execute('SELECT * FROM telemetry WHERE id = ?', (entry_id,))
-    row = cursor.fetchone()
-    
-    if not row:
-        db.close()
-        return jsonify({'error': 'Telemetry entry not found'}), 404
+    # RETURNING hands back the deleted id, so a missing row is detected without a separate SELECT
+    with util.transaction(db):
+        if DELETE_RETURNING:
+            cursor.execute(SQL_DELETE, (entry_id,))
+            deleted = cursor.fetchone() is not None
+        else:
+            cursor.execute(SQL_DELETE_NO_RETURNING, (entry_id,))
+            deleted = cursor.rowcount > 0
     
-    cursor.execute('DELETE FROM telemetry WHERE id = ?', (entry_id,))
-    db.commit()
-    db.close()
+    if not deleted:
+        return json_response({'error': 'Telemetry entry not found'}, 404)
     
-    return jsonify({'message': 'Telemetry entry deleted'}), 200
+    return json_response({'message': 'Telemetry entry deleted'}, 200)
 
 
-@app.route('/')
-def index():
+def serve_frontend():
     """
-    Serve the React frontend.
+    Serve the built React frontend from `DIST_DIR`, if it has been built.
     
-    In a production system, you would likely want to have more robust handling here,
-    possibly with error handling for missing files, etc.
-    In a production system, you might also want to serve different files based on routes and 
-    be able to scale static file serving by adding it in another k8s service or using a CDN.
-    Basically, move it closer to the user and away from the application server.
-    But this is not a production system, so keeping it simple for now
+    WhiteNoise sits in front of Flask and answers static requests before they reach any Flask routing or hooks.
+    It indexes the files and builds their headers once at startup, and lets gunicorn send them with sendfile().
+    In a larger deployment this would move further out again, to a CDN or its own service.
+    In development Vite serves the frontend instead, and there is no `DIST_DIR` to wrap.
     """
-    return app.send_static_file('index.html')
+    if os.path.isdir(DIST_DIR):
+        app.wsgi_app = WhiteNoise(app.wsgi_app, root=DIST_DIR, index_file=True)
+
 
+serve_frontend()
@@ -0,0 +1,22 @@
+"""
+Gunicorn settings for serving the telemetry API.
+
+Gunicorn loads this file automatically when it is started from this directory, which is what the Docker image does.
+The handlers spend most of their time waiting on SQLite rather than running Python, so each worker process runs
+a pool of threads instead of serving a single request at a time. WAL mode lets those threads read concurrently.
+"""
+
+import os
+
+bind = ':5000'
+
+# A few processes, each with a pool of threads for the I/O-bound handlers.
+# SQLite has a single write lock and each process has its own batch writer, so extra processes mostly queue on that
+# lock and run into the busy timeout. The core count is also the host's rather than the container's limit, so it is
+# not a good default here. Concurrency comes from threads, and WEB_CONCURRENCY still overrides the process count.
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 16))
+
+# Import the app once in the master so init_db runs a single time instead of racing in every worker.
+preload_app = True
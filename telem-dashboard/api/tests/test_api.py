@@ -7,29 +7,71 @@ Tests cover:
 """
 
 import unittest
-import json
 import os
+import random
+import re
+import shutil
 import sqlite3
 import tempfile
-from unittest.mock import patch, MagicMock
+import uuid
+from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from unittest.mock import patch
+
+import orjson
+from werkzeug.test import Client
+from whitenoise import WhiteNoise
 
-import api
 import util
 
+# Scratch files for the whole module: the template database below and the database `api` opens at import.
+TEMPLATE_DIR = tempfile.TemporaryDirectory()
+
+# api initializes DATABASE_LOCATION as soon as it is imported, so point it at a scratch file first.
+# Otherwise importing it would migrate the bundled telemetry.db.
+API_DB = os.path.join(TEMPLATE_DIR.name, 'api.db')
+os.environ['DATABASE_LOCATION'] = API_DB
+
+import api  # noqa: E402
+
+# A valid telemetry entry. Tests that need a variation copy it, the unchanged entry is encoded once here.
+BASE_PAYLOAD = {
+    'satelliteId': 'SAT001',
+    'timestamp': '2025-12-10T10:00:00Z',
+    'altitude': 400,
+    'velocity': 7.8,
+    'status': 'healthy'
+}
+BASE_PAYLOAD_JSON = orjson.dumps(BASE_PAYLOAD)
+
+# The schema is built once into a template database and copied for each test, instead of running init_db per test.
+TEMPLATE_DB = os.path.join(TEMPLATE_DIR.name, 'template.db')
+util.init_db(TEMPLATE_DB)
+
+# One test client for the whole module. It keeps no state between requests, since the API sets no cookies.
+CLIENT = api.app.test_client()
+
+
+def tearDownModule():
+    """Remove the template and import-time databases once every test in the module has run."""
+    util.close_pool(API_DB)
+    del os.environ['DATABASE_LOCATION']
+    TEMPLATE_DIR.cleanup()
+
 
 class UtilFunctionsTestCase(unittest.TestCase):
     """Test cases for util.py functions."""
 
     def setUp(self):
         """Set up test database."""
-        self.temp_db_fd, self.temp_db_path = tempfile.mkstemp(suffix='.db')
-        util.init_db(self.temp_db_path)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_db_path = os.path.join(self.temp_dir.name, 'test.db')
+        shutil.copyfile(TEMPLATE_DB, self.temp_db_path)
 
     def tearDown(self):
-        """Clean up test database."""
-        os.close(self.temp_db_fd)
-        if os.path.exists(self.temp_db_path):
-            os.remove(self.temp_db_path)
+        """Clean up test database, along with any WAL and shared-memory files beside it."""
+        util.close_pool(self.temp_db_path)
+        self.temp_dir.cleanup()
 
     def test_init_db_creates_table(self):
         """Test that init_db creates the telemetry table."""
@@ -58,10 +100,97 @@ class UtilFunctionsTestCase(unittest.TestCase):
         self.assertEqual(column_names, expected_columns)
         db.close()
 
+    def test_init_db_creates_indexes(self):
+        """Test that init_db creates the indexes used by the GET filters."""
+        db = util.get_db(self.temp_db_path)
+        cursor = db.cursor()
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='telemetry'")
+        index_names = {row['name'] for row in cursor.fetchall()}
+
+        for name in ('idx_sat_status_id', 'idx_timestamp', 'idx_altitude', 'idx_status_altitude'):
+            self.assertIn(name, index_names)
+        # (status) would only duplicate the leading column of (status, altitude)
+        self.assertNotIn('idx_status', index_names)
+        db.close()
+
+    def test_filter_query_uses_index(self):
+        """Test that a satelliteId and status filter is answered from an index."""
+        db = util.get_db(self.temp_db_path)
+        cursor = db.cursor()
+
+        cursor.execute(
+            'EXPLAIN QUERY PLAN SELECT COUNT(*) FROM telemetry WHERE satelliteId = ? AND status = ?',
+            ('SAT001', 'healthy')
+        )
+        plan = ' '.join(row['detail'] for row in cursor.fetchall())
+
+        self.assertIn('idx_sat_status_id', plan)
+        db.close()
+
+    def test_altitude_sort_uses_index(self):
+        """Test that offset and keyset pages sorted by altitude are read in index order instead of being sorted."""
+        db = util.get_db(self.temp_db_path)
+        cursor = db.cursor()
+
+        for has_status in (False, True):
+            for sort_order in ('asc', 'desc'):
+                for keyset in (False, True):
+                    with self.subTest(has_status=has_status, sort_order=sort_order, keyset=keyset):
+                        query = api.LIST_QUERIES[('altitude', sort_order, False, has_status, keyset)]
+                        params = ('healthy',) if has_status else ()
+                        params += (400.0, 1, 20) if keyset else (20, 0)
+                        cursor.execute('EXPLAIN QUERY PLAN ' + query, params)
+                        plan = ' '.join(row['detail'] for row in cursor.fetchall())
+
+                        self.assertIn('idx_status_altitude' if has_status else 'idx_altitude', plan)
+                        self.assertNotIn('TEMP B-TREE', plan)
+        db.close()
+
+    def test_init_db_row_count_triggers(self):
+        """Test that the meta row count follows inserts and deletes."""
+        db = util.get_db(self.temp_db_path)
+        cursor = db.cursor()
+        count_query = "SELECT value FROM meta WHERE key = 'telemetry_count'"
+
+        cursor.execute(count_query)
+        self.assertEqual(cursor.fetchone()['value'], 0)
+
+        for sat_id in ('SAT001', 'SAT002', 'SAT003'):
+            cursor.execute('''
+                INSERT INTO telemetry (satelliteId, timestamp, altitude, velocity, status)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (sat_id, '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'))
+        cursor.execute("DELETE FROM telemetry WHERE satelliteId = 'SAT002'")
+        db.commit()
+
+        cursor.execute(count_query)
+        self.assertEqual(cursor.fetchone()['value'], 2)
+        db.close()
+
+    def test_init_db_row_count_existing_rows(self):
+        """Test that init_db seeds the row count from a table that already has rows."""
+        db = util.get_db(self.temp_db_path)
+        db.execute('''
+            INSERT INTO telemetry (satelliteId, timestamp, altitude, velocity, status)
+            VALUES (?, ?, ?, ?, ?)
+        ''', ('SAT001', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'))
+        db.execute('DROP TABLE meta')
+        db.commit()
+        db.close()
+
+        util.init_db(self.temp_db_path)
+
+        db = util.get_db(self.temp_db_path)
+        row = db.execute("SELECT value FROM meta WHERE key = 'telemetry_count'").fetchone()
+        self.assertEqual(row['value'], 1)
+        db.close()
+
     def test_init_db_idempotent(self):
         """Test that init_db can be called multiple times without error."""
-        # Should not raise an error
+        # Should not raise an error. Forget the database between calls so the second one runs the schema again.
         util.init_db(self.temp_db_path)
+        util.initialized.discard(self.temp_db_path)
         util.init_db(self.temp_db_path)
         
         db = util.get_db(self.temp_db_path)
@@ -72,6 +201,18 @@ class UtilFunctionsTestCase(unittest.TestCase):
         self.assertIsNotNone(result)
         db.close()
 
+    def test_init_db_runs_once_per_database(self):
+        """Test that init_db skips a database it has already set up, but not an in-memory one."""
+        util.init_db(self.temp_db_path)
+        with patch.object(util, 'get_db', wraps=util.get_db) as get_db:
+            util.init_db(self.temp_db_path)
+            get_db.assert_not_called()
+
+            memory_db = f'file:init_{uuid.uuid4().hex}?mode=memory&cache=shared'
+            util.init_db(memory_db)
+            util.init_db(memory_db)
+            self.assertEqual(get_db.call_count, 2)
+
     def test_get_db_returns_connection(self):
         """Test that get_db returns a valid database connection."""
         db = util.get_db(self.temp_db_path)
@@ -105,853 +246,1361 @@ class UtilFunctionsTestCase(unittest.TestCase):
         
         db.close()
 
-    def test_get_db_creates_file(self):
-        """Test that get_db creates database file if it doesn't exist."""
-        new_db_path = os.path.join(tempfile.gettempdir(), 'test_new_db.db')
-        
-        # Ensure it doesn't exist
-        if os.path.exists(new_db_path):
-            os.remove(new_db_path)
-        
-        db = util.get_db(new_db_path)
-        self.assertTrue(os.path.exists(new_db_path))
+    def test_get_db_wal_mode(self):
+        """Test that get_db puts the database in WAL journal mode."""
+        db = util.get_db(self.temp_db_path)
+        mode = db.execute('PRAGMA journal_mode').fetchone()[0]
+        self.assertEqual(mode, 'wal')
         db.close()
-        
-        # Cleanup
-        if os.path.exists(new_db_path):
-            os.remove(new_db_path)
 
+    def test_get_db_connection_pragmas(self):
+        """Test that get_db applies the per-connection tuning pragmas."""
+        db = util.get_db(self.temp_db_path)
+        self.assertEqual(db.execute('PRAGMA synchronous').fetchone()[0], 1)  # NORMAL
+        self.assertEqual(db.execute('PRAGMA temp_store').fetchone()[0], 2)  # MEMORY
+        self.assertEqual(db.execute('PRAGMA cache_size').fetchone()[0], -65536)
+        db.close()
 
-class ValidationFunctionsTestCase(unittest.TestCase):
-    """Test cases for validation functions in api.py."""
+    def test_transaction_commits(self):
+        """Test that transaction() commits the block's writes on an autocommit connection."""
+        db = util.get_db(self.temp_db_path)
+        self.assertIsNone(db.isolation_level)
+
+        with util.transaction(db):
+            db.execute('''
+                INSERT INTO telemetry (satelliteId, timestamp, altitude, velocity, status)
+                VALUES (?, ?, ?, ?, ?)
+            ''', ('SAT001', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'))
+        self.assertFalse(db.in_transaction)
+        db.close()
 
-    def test_validate_iso_valid_z_format(self):
-        """Test ISO 8601 validation with Z timezone."""
-        self.assertTrue(api.validate_iso('2025-12-10T10:00:00Z'))
+        db = util.get_db(self.temp_db_path)
+        self.assertEqual(db.execute('SELECT COUNT(*) FROM telemetry').fetchone()[0], 1)
+        db.close()
 
-    def test_validate_iso_valid_plus_offset(self):
-        """Test ISO 8601 validation with +00:00 offset."""
-        self.assertTrue(api.validate_iso('2025-12-10T10:00:00+00:00'))
+    def test_transaction_rolls_back_on_error(self):
+        """Test that transaction() rolls back and re-raises when the block fails."""
+        db = util.get_db(self.temp_db_path)
 
-    def test_validate_iso_valid_with_milliseconds(self):
-        """Test ISO 8601 validation with milliseconds."""
-        self.assertTrue(api.validate_iso('2025-12-10T10:00:00.000Z'))
+        with self.assertRaises(sqlite3.IntegrityError):
+            with util.transaction(db):
+                db.execute('''
+                    INSERT INTO telemetry (satelliteId, timestamp, altitude, velocity, status)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', ('SAT001', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'))
+                db.execute('INSERT INTO telemetry (satelliteId) VALUES (NULL)')
 
-    def test_validate_iso_valid_without_timezone(self):
-        """Test ISO 8601 validation without timezone."""
-        self.assertTrue(api.validate_iso('2025-12-10T10:00:00'))
+        self.assertFalse(db.in_transaction)
+        self.assertEqual(db.execute('SELECT COUNT(*) FROM telemetry').fetchone()[0], 0)
+        db.close()
 
-    def test_validate_iso_valid_negative_offset(self):
-        """Test ISO 8601 validation with negative offset."""
-        self.assertTrue(api.validate_iso('2025-12-10T10:00:00-05:00'))
+    def test_transaction_keeps_error_after_automatic_rollback(self):
+        """Test that transaction() re-raises the block's error when SQLite has already rolled the transaction back."""
+        db = util.get_db(self.temp_db_path)
 
-    def test_validate_iso_invalid_format(self):
-        """Test ISO 8601 validation with invalid format."""
-        self.assertFalse(api.validate_iso('12-10-2025'))
+        # Stands in for the errors after which SQLite ends the transaction itself, like SQLITE_FULL
+        with self.assertRaises(ValueError):
+            with util.transaction(db):
+                db.execute('ROLLBACK')
+                raise ValueError('disk full')
 
-    def test_validate_iso_invalid_date_slash(self):
-        """Test ISO 8601 validation with slashes."""
-        self.assertFalse(api.validate_iso('2025/12/10'))
+        self.assertFalse(db.in_transaction)
+        db.close()
 
-    def test_validate_iso_invalid_month(self):
-        """Test ISO 8601 validation with invalid month."""
-        self.assertFalse(api.validate_iso('2025-13-01T00:00:00Z'))
+    def test_batch_writer_write(self):
+        """Test that BatchWriter writes a batch in one go and resolves each row's id in order."""
+        writer = util.BatchWriter('''
+            INSERT INTO telemetry (satelliteId, timestamp, altitude, velocity, status)
+            VALUES (?, ?, ?, ?, ?)
+        ''')
+        futures = [Future() for _ in range(3)]
+        writer.write([
+            (self.temp_db_path, (f'SAT00{i}', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'), future)
+            for i, future in enumerate(futures)
+        ])
 
-    def test_validate_iso_invalid_day(self):
-        """Test ISO 8601 validation with invalid day."""
-        self.assertFalse(api.validate_iso('2025-12-32T00:00:00Z'))
+        self.assertEqual([future.result() for future in futures], [1, 2, 3])
 
-    def test_validate_iso_non_string(self):
-        """Test ISO 8601 validation with non-string input."""
-        self.assertFalse(api.validate_iso(12345))
+        db = util.get_db(self.temp_db_path)
+        rows = db.execute('SELECT id, satelliteId FROM telemetry ORDER BY id').fetchall()
+        self.assertEqual([tuple(row) for row in rows], [(1, 'SAT000'), (2, 'SAT001'), (3, 'SAT002')])
+        db.close()
 
-    def test_validate_iso_empty_string(self):
-        """Test ISO 8601 validation with empty string."""
-        self.assertFalse(api.validate_iso(''))
+    def test_batch_writer_insert(self):
+        """Test that BatchWriter.insert starts the writer thread and returns the committed id."""
+        writer = util.BatchWriter('''
+            INSERT INTO telemetry (satelliteId, timestamp, altitude, velocity, status)
+            VALUES (?, ?, ?, ?, ?)
+        ''')
+        row = ('SAT001', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy')
 
-    def test_validate_iso_none(self):
-        """Test ISO 8601 validation with None."""
-        self.assertFalse(api.validate_iso(None))
+        self.assertEqual(writer.insert(self.temp_db_path, row), 1)
+        self.assertEqual(writer.insert(self.temp_db_path, row), 2)
+        self.assertTrue(writer.thread.is_alive())
 
-    def test_validate_status_healthy(self):
-        """Test status validation with 'healthy'."""
-        self.assertTrue(api.validate_status('healthy'))
+    def test_batch_writer_write_isolates_bad_row(self):
+        """Test that a row the database rejects fails only its own future, not the rest of its batch."""
+        writer = util.BatchWriter(api.SQL_INSERT)
+        rows = [
+            ('SAT001', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'),
+            (None, '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'),
+            ('SAT003', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'),
+        ]
+        futures = [Future() for _ in rows]
+        writer.write([(self.temp_db_path, row, future) for row, future in zip(rows, futures)])
 
-    def test_validate_status_critical(self):
-        """Test status validation with 'critical'."""
-        self.assertTrue(api.validate_status('critical'))
+        self.assertIsInstance(futures[1].exception(), sqlite3.IntegrityError)
+        ids = [futures[0].result(), futures[2].result()]
 
-    def test_validate_status_case_sensitive(self):
-        """Test status validation is case sensitive."""
-        self.assertFalse(api.validate_status('Healthy'))
-        self.assertFalse(api.validate_status('CRITICAL'))
+        db = util.get_db(self.temp_db_path)
+        saved = db.execute('SELECT id, satelliteId FROM telemetry ORDER BY id').fetchall()
+        self.assertEqual([tuple(row) for row in saved], list(zip(ids, ('SAT001', 'SAT003'))))
+        db.close()
 
-    def test_validate_status_invalid(self):
-        """Test status validation with invalid value."""
-        self.assertFalse(api.validate_status('warning'))
+    def test_batch_writer_insert_times_out(self):
+        """Test that insert gives up instead of hanging when no writer thread commits the row, and the row is never written."""
+        writer = util.BatchWriter(api.SQL_INSERT)
+        row = ('SAT001', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy')
 
-    def test_validate_status_empty(self):
-        """Test status validation with empty string."""
-        self.assertFalse(api.validate_status(''))
+        with patch.object(util, 'WRITE_TIMEOUT', 0.01), patch.object(writer, 'start'):
+            with self.assertRaises(FutureTimeoutError):
+                writer.insert(self.temp_db_path, row)
 
-    def test_validate_status_none(self):
-        """Test status validation with None."""
-        self.assertFalse(api.validate_status(None))
+        # The timed out row is still queued, the writer must skip it rather than commit it
+        writer.write([writer.queue.get_nowait()])
+        db = util.get_db(self.temp_db_path)
+        self.assertEqual(db.execute('SELECT COUNT(*) FROM telemetry').fetchone()[0], 0)
+        db.close()
 
+    def test_connection_pool_reuses_connection(self):
+        """Test that a released connection is handed out again instead of opening a new one."""
+        pool = util.ConnectionPool(self.temp_db_path)
+        db = pool.acquire()
+        self.assertEqual(pool.stats(), {'active': 1, 'idle': 0})
+
+        pool.release(db)
+        self.assertEqual(pool.stats(), {'active': 0, 'idle': 1})
+        self.assertIs(pool.acquire(), db)
+        pool.release(db)
+        pool.close()
+
+    def test_connection_pool_release_rolls_back(self):
+        """Test that release() rolls back a transaction the caller left open."""
+        pool = util.ConnectionPool(self.temp_db_path)
+        db = pool.acquire()
+        db.execute('BEGIN')
+        db.execute('''
+            INSERT INTO telemetry (satelliteId, timestamp, altitude, velocity, status)
+            VALUES (?, ?, ?, ?, ?)
+        ''', ('SAT001', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'))
+        pool.release(db)
 
-class TelemetryAPITestCase(unittest.TestCase):
-    """Test cases for the Telemetry API endpoints."""
+        self.assertFalse(db.in_transaction)
+        self.assertEqual(db.execute('SELECT COUNT(*) FROM telemetry').fetchone()[0], 0)
+        pool.close()
 
-    def setUp(self):
-        """Set up test client and test database."""
-        self.temp_db_fd, self.temp_db_path = tempfile.mkstemp(suffix='.db')
-        util.init_db(self.temp_db_path)
-        
-        # Patch the DATABASE constant in api module
-        self.patcher = patch.object(api, 'DATABASE', self.temp_db_path)
-        self.patcher.start()
-        
-        self.client = api.app.test_client()
-        self.app = api.app
+    def test_connection_pool_closes_beyond_max_idle(self):
+        """Test that connections released into a full pool are closed rather than kept."""
+        pool = util.ConnectionPool(self.temp_db_path, max_idle=1)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
 
-    def tearDown(self):
-        """Clean up test database and patches."""
-        self.patcher.stop()
-        os.close(self.temp_db_fd)
-        if os.path.exists(self.temp_db_path):
-            os.remove(self.temp_db_path)
+        self.assertEqual(pool.stats(), {'active': 0, 'idle': 1})
+        with self.assertRaises(sqlite3.ProgrammingError):
+            second.execute('SELECT 1')
+        pool.close()
 
-    def insert_sample_data(self):
+    def test_get_pool_shared_per_database(self):
+        """Test that get_pool returns one pool per database until close_pool forgets it."""
+        pool = util.get_pool(self.temp_db_path)
+        self.assertIs(util.get_pool(self.temp_db_path), pool)
+
+        util.close_pool(self.temp_db_path)
+        self.assertIsNot(util.get_pool(self.temp_db_path), pool)
+
+    def test_get_db_creates_file(self):
+        """Test that get_db creates database file if it doesn't exist."""
+        # A fresh directory guarantees the file does not exist yet and is removed afterwards
+        with tempfile.TemporaryDirectory() as temp_dir:
+            new_db_path = os.path.join(temp_dir, 'new.db')
+            
+            db = util.get_db(new_db_path)
+            self.assertTrue(os.path.exists(new_db_path))
+            db.close()
+
+
+class ValidationFunctionsTestCase(unittest.TestCase):
+    """Test cases for validation functions in api.py."""
+
+    # (input, expected, description) tables, checked in one test each with a subTest per case
+    ISO_CASES = (
+        ('2025-12-10T10:00:00Z', True, 'Z timezone'),
+        ('2025-12-10T10:00:00+00:00', True, '+00:00 offset'),
+        ('2025-12-10T10:00:00.000Z', True, 'milliseconds'),
+        ('2025-12-10T10:00:00', True, 'no timezone'),
+        ('2025-12-10T10:00:00-05:00', True, 'negative offset'),
+        ('2025-12-10', True, 'date and no time'),
+        ('2024-02-29T00:00:00Z', True, 'leap day in a leap year'),
+        ('2025-02-29T00:00:00Z', False, 'leap day outside a leap year'),
+        ('12-10-2025', False, 'month-day-year order'),
+        ('20x5-12-10', False, 'non-digit in the year'),
+        ('202', False, 'shorter than a year'),
+        ('2025-12-10T10:00:00+05:30' + '0' * 10000, False, 'long trailing garbage'),
+        ('2025/12/10', False, 'slashes'),
+        ('2025-13-01T00:00:00Z', False, 'month out of range'),
+        ('2025-12-32T00:00:00Z', False, 'day out of range'),
+        ('2025-12-10T24:00:00Z', False, 'hour out of range'),
+        ('2025-12-10T10:00:00+05:60', False, 'offset minutes out of range'),
+        ('２０２５-12-10T10:00:00Z', False, 'non-ASCII digits'),
+        (12345, False, 'non-string'),
+        ('', False, 'empty string'),
+        (None, False, 'None'),
+    )
+
+    STATUS_CASES = (
+        ('healthy', True, 'healthy'),
+        ('critical', True, 'critical'),
+        ('Healthy', False, 'case sensitive'),
+        ('CRITICAL', False, 'case sensitive'),
+        ('warning', False, 'unknown value'),
+        ('', False, 'empty string'),
+        (None, False, 'None'),
+        (['healthy'], False, 'unhashable JSON value'),
+    )
+
+    def test_validate_iso(self):
+        """Test ISO 8601 validation against the accepted and rejected timestamp table."""
+        for value, expected, description in self.ISO_CASES:
+            with self.subTest(description, value=value):
+                self.assertIs(api.validate_iso(value), expected)
+
+    def test_validate_iso_fuzz(self):
+        """Test validate_iso agrees with datetime.fromisoformat on a seeded batch of random dates and offsets."""
+        rng = random.Random(0)
+        # Bound once so the loop does not repeat the module and attribute lookups on every pass
+        randint, choice = rng.randint, rng.choice
+        fromisoformat, validate_iso = datetime.fromisoformat, api.validate_iso
+        for _ in range(500):
+            year = choice((1900, 2000, 2023, 2024, 2025))
+            month = randint(0, 15)
+            day = randint(0, 35)
+            # Offset minutes stay in range: fromisoformat adds :61 up as a timedelta, validate_iso rejects it
+            offset = choice(('Z', f'+{randint(0, 25):02d}:{randint(0, 59):02d}', f'-{randint(0, 25):02d}:00'))
+            timestamp = f'{year}-{month:02d}-{day:02d}T{randint(0, 23):02d}:{randint(0, 59):02d}:00{offset}'
+
+            try:
+                fromisoformat(timestamp.replace('Z', '+00:00'))
+                expected = True
+            except ValueError:
+                expected = False
+
+            with self.subTest(timestamp=timestamp):
+                self.assertIs(validate_iso(timestamp), expected)
+
+    def test_validate_iso_uses_precompiled_pattern(self):
+        """Test that validate_iso matches with the module-level ISO_8601 pattern instead of compiling one per call."""
+        self.assertIsInstance(api.ISO_8601, re.Pattern)
+
+        with patch.object(api, 'ISO_8601', wraps=api.ISO_8601) as pattern, patch('re.compile') as compile_pattern:
+            self.assertTrue(api.validate_iso('2025-12-10T10:00:00Z'))
+
+        pattern.fullmatch.assert_called_once_with('2025-12-10T10:00:00Z')
+        compile_pattern.assert_not_called()
+
+    def test_validate_status(self):
+        """Test status validation against the accepted and rejected status table."""
+        for value, expected, description in self.STATUS_CASES:
+            with self.subTest(description, value=value):
+                self.assertIs(api.validate_status(value), expected)
+
+    def test_validate_telemetry_status_matches_validate_status(self):
+        """Test that validate_telemetry's inlined status check accepts exactly what validate_status does."""
+        for value, expected, description in self.STATUS_CASES:
+            with self.subTest(description, value=value):
+                row, error = api.validate_telemetry({**BASE_PAYLOAD, 'status': value})
+                self.assertIs(error is None, expected)
+
+    def test_telemetry_dicts_keys_match_columns(self):
+        """Test that telemetry_dicts keys each value by its TELEMETRY_COLUMNS name and drops extra columns."""
+        row = (1, 'SAT001', '2025-12-10T10:00:00Z', 400.0, 7.8, 'healthy', 42)
+        data = api.telemetry_dicts([row])
+
+        self.assertEqual(list(data[0].items()), list(zip(api.TELEMETRY_COLUMNS, row)))
+
+    def test_validate_telemetry_valid(self):
+        """Test entry validation returns the row in insert order."""
+        row, error = api.validate_telemetry({
+            'status': 'healthy',
+            'velocity': 7,
+            'altitude': '400.5',
+            'timestamp': '2025-12-10T10:00:00Z',
+            'satelliteId': 'SAT001'
+        })
+        self.assertIsNone(error)
+        self.assertEqual(row, ('SAT001', '2025-12-10T10:00:00Z', 400.5, 7.0, 'healthy'))
+
+    def test_validate_telemetry_reports_first_missing_field(self):
+        """Test entry validation names the first missing field in schema order."""
+        row, error = api.validate_telemetry({'satelliteId': 'SAT001', 'velocity': 7.8})
+        self.assertIsNone(row)
+        self.assertEqual(error, 'Missing required field: timestamp')
+
+
+class APITestCase(unittest.TestCase):
+    """Shared setup for the API test classes, it holds no tests of its own."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the test client and the database shared by every test in the class."""
+        # A named in-memory database. The shared cache lets every connection the app opens see it,
+        # and the keepalive connection stops SQLite from discarding it when those connections close.
+        cls.temp_db_path = f'file:telemetry_{uuid.uuid4().hex}?mode=memory&cache=shared'
+        cls.keepalive = sqlite3.connect(cls.temp_db_path, uri=True)
+        template = sqlite3.connect(TEMPLATE_DB)
+        template.backup(cls.keepalive)
+        template.close()
+        
+        # Point the api module at the test database, restored in tearDownClass
+        cls.original_database = api.DATABASE
+        api.DATABASE = cls.temp_db_path
+        
+        cls.client = CLIENT
+        cls.app = api.app
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared database and patches."""
+        api.DATABASE = cls.original_database
+        util.close_pool(cls.temp_db_path)
+        cls.keepalive.close()
+
+    @classmethod
+    def insert_sample_data(cls):
         """Insert sample telemetry data for testing."""
-        db = util.get_db(self.temp_db_path)
-        cursor = db.cursor()
-        
-        sample_data = [
+        cls.insert_rows([
             ('SAT001', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'),
             ('SAT001', '2025-12-10T11:00:00Z', 410, 7.9, 'healthy'),
             ('SAT001', '2025-12-10T12:00:00Z', 350, 6.5, 'critical'),
             ('SAT002', '2025-12-10T10:30:00Z', 500, 8.0, 'healthy'),
             ('SAT002', '2025-12-10T11:30:00Z', 510, 8.1, 'healthy'),
             ('SAT003', '2025-12-10T09:00:00Z', 300, 6.0, 'critical'),
+        ])
+
+    @classmethod
+    def insert_rows(cls, rows):
+        """Insert (satelliteId, timestamp, altitude, velocity, status) rows straight into the database."""
+        # Borrow a connection from the pool the app uses instead of opening and tuning a new one each call
+        pool = util.get_pool(cls.temp_db_path)
+        db = pool.acquire()
+        
+        # One prepared statement and one transaction for all the rows
+        try:
+            with util.transaction(db):
+                db.executemany(api.SQL_INSERT, rows)
+        finally:
+            pool.release(db)
+
+    def bulk_payload(self, count):
+        """Build a list of valid telemetry entries for the bulk endpoint."""
+        return [
+            {
+                'satelliteId': f'SAT{i:03d}',
+                'timestamp': f'2025-12-10T{10 + i:02d}:00:00Z',
+                'altitude': 400 + i,
+                'velocity': 7.8,
+                'status': 'healthy'
+            }
+            for i in range(count)
         ]
+
+    def post_json(self, path, obj):
+        """POST `obj` as JSON, encoded once with orjson rather than by the test client's stdlib encoder."""
+        return self.client.post(path, data=orjson.dumps(obj), content_type='application/json')
+
+    def bulk_post(self, payloads):
+        """POST a list of telemetry entries to the bulk endpoint in one request."""
+        return self.post_json('/telemetry/bulk', payloads)
+
+
+class TelemetryAPITestCase(APITestCase):
+    """Test cases for the Telemetry API endpoints."""
+
+    def setUp(self):
+        """Empty the shared database and restart ids at 1, tests like GET /telemetry/1 rely on that."""
+        # The delete trigger brings the meta row count back to 0 along with the rows
+        self.keepalive.executescript('''
+            DELETE FROM telemetry;
+            DELETE FROM sqlite_sequence WHERE name = 'telemetry';
+        ''')
+
+    # ===== Request-scoped connection Tests =====
+
+    def test_get_db_reused_within_app_context(self):
+        """Test that api.get_db returns the same connection within one app context."""
+        with self.app.app_context():
+            db1 = api.get_db()
+            db2 = api.get_db()
+            self.assertIs(db1, db2)
+
+    def test_get_db_returned_to_pool_on_teardown(self):
+        """Test that the request connection goes back to the pool when the app context ends."""
+        with self.app.app_context():
+            db = api.get_db()
+            self.assertEqual(util.get_pool(self.temp_db_path).stats()['active'], 1)
+
+        self.assertEqual(util.get_pool(self.temp_db_path).stats()['active'], 0)
+        with self.app.app_context():
+            self.assertIs(api.get_db(), db)
+
+    def test_pooled_connections_share_memory_database(self):
+        """Test that separate pooled connections to the shared-cache URI all see the same in-memory database."""
+        pool = util.get_pool(self.temp_db_path)
+        writer, reader = pool.acquire(), pool.acquire()
+        try:
+            self.assertIsNot(writer, reader)
+            with util.transaction(writer):
+                writer.execute(api.SQL_INSERT, ('SAT001', '2025-12-10T10:00:00Z', 400, 7.8, 'healthy'))
+            self.assertEqual(reader.execute('SELECT COUNT(*) FROM telemetry').fetchone()[0], 1)
+        finally:
+            pool.release(writer)
+            pool.release(reader)
+
+    def test_pool_health(self):
+        """Test that the pool-health endpoint reports active and idle connection counts."""
+        response = self.client.get('/telemetry/pool-health')
+        self.assertEqual(response.status_code, 200)
         
-        for sat_id, timestamp, altitude, velocity, status in sample_data:
-            cursor.execute('''
-                INSERT INTO telemetry (satelliteId, timestamp, altitude, velocity, status)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (sat_id, timestamp, altitude, velocity, status))
-        
-        db.commit()
+        data = response.get_json()
+        self.assertEqual(set(data), {'active', 'idle'})
+        self.assertEqual(data['active'], 0)
+
+    def test_api_uses_in_memory_database(self):
+        """Test that the API tests run against the class's in-memory database, not a file on disk."""
+        self.assertIn('mode=memory', self.temp_db_path)
+        self.assertEqual(api.DATABASE, self.temp_db_path)
+        with self.app.app_context():
+            db = api.get_db()
+            # An in-memory database reports an empty file name
+            self.assertEqual(db.execute('PRAGMA database_list').fetchone()['file'], '')
+
+    def test_frontend_served_in_front_of_api(self):
+        """Test that serve_frontend puts WhiteNoise in front of the app, serving the build and passing API calls through."""
+        # serve_frontend replaces app.wsgi_app, put the unwrapped app back afterwards
+        self.addCleanup(setattr, self.app, 'wsgi_app', self.app.wsgi_app)
+        with tempfile.TemporaryDirectory() as dist_dir:
+            with open(os.path.join(dist_dir, 'index.html'), 'w') as f:
+                f.write('<html>dashboard</html>')
+
+            with patch.object(api, 'DIST_DIR', dist_dir):
+                api.serve_frontend()
+            self.assertIsInstance(self.app.wsgi_app, WhiteNoise)
+            client = Client(self.app)
+
+            response = client.get('/')
+            self.assertEqual(response.status_code, 200)
+            self.assertIn(b'dashboard', response.data)
+            # Release WhiteNoise's file handle before the directory is removed
+            response.close()
+
+            response = client.get('/telemetry')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.mimetype, 'application/json')
+
+    def test_frontend_not_served_without_build(self):
+        """Test that serve_frontend leaves the app unwrapped when the frontend has not been built."""
+        wsgi_app = self.app.wsgi_app
+        with tempfile.TemporaryDirectory() as parent:
+            with patch.object(api, 'DIST_DIR', os.path.join(parent, 'dist')):
+                api.serve_frontend()
+        self.assertEqual(self.app.wsgi_app, wsgi_app)
+
+    def test_precomputed_queries_are_valid(self):
+        """Test that every precomputed list and count query compiles against the schema."""
+        self.assertEqual(len(api.LIST_QUERIES), 6 * 2 * 2 * 2 * 2)
+
+        db = util.get_db(self.temp_db_path)
+        for query in list(api.LIST_QUERIES.values()) + list(api.COUNT_QUERIES.values()):
+            db.execute('EXPLAIN ' + query, [None] * query.count('?'))
         db.close()
 
+    def test_api_statements_fit_statement_cache(self):
+        """Test that every distinct statement the API runs fits in each connection's prepared statement cache."""
+        statements = set(api.LIST_QUERIES.values()) | set(api.COUNT_QUERIES.values()) | {
+            api.SQL_GET_BY_ID, api.SQL_DELETE, api.SQL_DELETE_NO_RETURNING, api.SQL_TOTAL, api.SQL_INSERT, util.SQL_LAST_INSERT_ID,
+            'BEGIN IMMEDIATE', 'COMMIT', 'ROLLBACK',
+        }
+        self.assertLessEqual(len(statements), util.CACHED_STATEMENTS)
+
     # ===== GET /telemetry Tests =====
 
     def test_get_telemetry_empty(self):
         """Test GET /telemetry with empty database."""
         response = self.client.get('/telemetry')
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = response.get_json()
         
         self.assertEqual(data['data'], [])
         self.assertEqual(data['pagination']['page'], 1)
         self.assertEqual(data['pagination']['total'], 0)
 
-    def test_get_telemetry_all_data(self):
-        """Test GET /telemetry returns all data."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?per_page=100')
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
-        
-        self.assertEqual(len(data['data']), 6)
-        self.assertEqual(data['pagination']['total'], 6)
-
-    def test_get_telemetry_pagination_first_page(self):
-        """Test GET /telemetry pagination first page."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?page=1&per_page=2')
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
-        
-        self.assertEqual(len(data['data']), 2)
-        self.assertEqual(data['pagination']['page'], 1)
-        self.assertEqual(data['pagination']['total_pages'], 3)
+    def test_get_telemetry_empty_skips_page_query(self):
+        """Test GET /telemetry answers from the count alone when it is zero."""
+        # With no page queries to look up, any attempt to run one would fail the request
+        with patch.dict(api.LIST_QUERIES, clear=True):
+            response = self.client.get('/telemetry')
+            self.assertEqual(response.status_code, 200)
+            data = response.get_json()
+            self.assertEqual(data['data'], [])
+            self.assertEqual(data['pagination']['total_pages'], 0)
+
+            self.insert_sample_data()
+            response = self.client.get('/telemetry?satelliteId=SAT999&after_id=0')
+            self.assertEqual(response.status_code, 200)
+            data = response.get_json()
+            self.assertEqual(data['data'], [])
+            self.assertEqual(data['pagination']['total'], 0)
 
-    def test_get_telemetry_pagination_second_page(self):
-        """Test GET /telemetry pagination second page."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?page=2&per_page=2')
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
-        
-        self.assertEqual(len(data['data']), 2)
-        self.assertEqual(data['pagination']['page'], 2)
+    # ===== GET /telemetry/<id> Tests =====
 
-    def test_get_telemetry_pagination_last_page(self):
-        """Test GET /telemetry pagination last page."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?page=3&per_page=2')
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+    def test_get_telemetry_by_id_not_found(self):
+        """Test GET /telemetry/<id> with non-existent id."""
+        response = self.client.get('/telemetry/999')
+        self.assertEqual(response.status_code, 404)
+        data = response.get_json()
         
-        self.assertEqual(len(data['data']), 2)
-        self.assertEqual(data['pagination']['page'], 3)
-
-    def test_get_telemetry_invalid_page_zero(self):
-        """Test GET /telemetry with page=0 defaults to page 1."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?page=0&per_page=20')
-        data = json.loads(response.data)
-        self.assertEqual(data['pagination']['page'], 1)
+        self.assertIn('error', data)
+        self.assertEqual(data['error'], 'Telemetry entry not found')
 
-    def test_get_telemetry_invalid_page_negative(self):
-        """Test GET /telemetry with negative page defaults to page 1."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?page=-5&per_page=20')
-        data = json.loads(response.data)
-        self.assertEqual(data['pagination']['page'], 1)
+    def test_get_telemetry_by_id_empty_database(self):
+        """Test GET /telemetry/<id> on empty database."""
+        response = self.client.get('/telemetry/1')
+        self.assertEqual(response.status_code, 404)
 
-    def test_get_telemetry_per_page_cap(self):
-        """Test GET /telemetry caps per_page at 100."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?per_page=500')
-        data = json.loads(response.data)
-        self.assertEqual(data['pagination']['per_page'], 100)
+    # ===== POST /telemetry Tests =====
 
-    def test_get_telemetry_per_page_minimum(self):
-        """Test GET /telemetry enforces minimum per_page of 1."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?per_page=0')
-        data = json.loads(response.data)
-        self.assertEqual(data['pagination']['per_page'], 1)
+    def test_post_telemetry_success(self):
+        """Test POST /telemetry with valid data."""
+        response = self.client.post(
+            '/telemetry',
+            data=BASE_PAYLOAD_JSON,
+            content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 201)
+        data = response.get_json()
+        self.assertIn('id', data)
+        self.assertEqual(data['message'], 'Telemetry entry added')
 
-    def test_get_telemetry_filter_by_satellite_id(self):
-        """Test GET /telemetry filtering by satelliteId."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?satelliteId=SAT001&per_page=100')
-        data = json.loads(response.data)
+    def test_post_telemetry_zero_altitude(self):
+        """Test POST /telemetry with zero altitude (valid)."""
+        payload = {**BASE_PAYLOAD, 'altitude': 0}
+        response = self.post_json('/telemetry', payload)
         
-        self.assertEqual(data['pagination']['total'], 3)
-        self.assertTrue(all(entry['satelliteId'] == 'SAT001' for entry in data['data']))
+        self.assertEqual(response.status_code, 201)
 
-    def test_get_telemetry_filter_by_status(self):
-        """Test GET /telemetry filtering by status."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?status=critical&per_page=100')
-        data = json.loads(response.data)
+    def test_post_telemetry_zero_velocity(self):
+        """Test POST /telemetry with zero velocity (valid)."""
+        payload = {**BASE_PAYLOAD, 'velocity': 0}
+        response = self.post_json('/telemetry', payload)
         
-        self.assertEqual(data['pagination']['total'], 2)
-        self.assertTrue(all(entry['status'] == 'critical' for entry in data['data']))
+        self.assertEqual(response.status_code, 201)
 
-    def test_get_telemetry_filter_by_both(self):
-        """Test GET /telemetry with both filters."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?satelliteId=SAT001&status=healthy&per_page=100')
-        data = json.loads(response.data)
+    def test_post_telemetry_creates_entry_in_db(self):
+        """Test that POST /telemetry creates entry in database."""
+        response = self.client.post(
+            '/telemetry',
+            data=BASE_PAYLOAD_JSON,
+            content_type='application/json'
+        )
         
-        self.assertEqual(data['pagination']['total'], 2)
-        self.assertTrue(all(entry['satelliteId'] == 'SAT001' for entry in data['data']))
-        self.assertTrue(all(entry['status'] == 'healthy' for entry in data['data']))
+        self.assertEqual(response.status_code, 201)
+        
+        # Verify entry exists
+        response_get = self.client.get('/telemetry/1')
+        self.assertEqual(response_get.status_code, 200)
+        data = response_get.get_json()
+        self.assertEqual(data['satelliteId'], 'SAT001')
 
-    def test_get_telemetry_filter_no_matches(self):
-        """Test GET /telemetry filter with no matches."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?satelliteId=NONEXISTENT&per_page=100')
-        data = json.loads(response.data)
+    def test_post_telemetry_float_altitude(self):
+        """Test POST /telemetry with float altitude."""
+        payload = {**BASE_PAYLOAD, 'altitude': 400.5}
+        response = self.post_json('/telemetry', payload)
         
-        self.assertEqual(data['pagination']['total'], 0)
-        self.assertEqual(len(data['data']), 0)
+        self.assertEqual(response.status_code, 201)
 
-    def test_get_telemetry_sort_by_id_asc(self):
-        """Test GET /telemetry sorting by id ascending."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?sort_by=id&sort_order=asc&per_page=100')
-        data = json.loads(response.data)
+    def test_post_telemetry_float_velocity(self):
+        """Test POST /telemetry with float velocity."""
+        payload = {**BASE_PAYLOAD, 'velocity': 7.8432}
+        response = self.post_json('/telemetry', payload)
         
-        ids = [entry['id'] for entry in data['data']]
-        self.assertEqual(ids, sorted(ids))
-        self.assertEqual(data['sorting']['sort_by'], 'id')
-        self.assertEqual(data['sorting']['sort_order'], 'asc')
+        self.assertEqual(response.status_code, 201)
 
-    def test_get_telemetry_sort_by_id_desc(self):
-        """Test GET /telemetry sorting by id descending."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?sort_by=id&sort_order=desc&per_page=100')
-        data = json.loads(response.data)
-        
-        ids = [entry['id'] for entry in data['data']]
-        self.assertEqual(ids, sorted(ids, reverse=True))
-        self.assertEqual(data['sorting']['sort_order'], 'desc')
+    def test_post_telemetry_concurrent(self):
+        """Test concurrent POST /telemetry requests each get their own id from the shared writer."""
+        payloads = self.bulk_payload(8)
 
-    def test_get_telemetry_sort_by_altitude(self):
-        """Test GET /telemetry sorting by altitude."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?sort_by=altitude&sort_order=asc&per_page=100')
-        data = json.loads(response.data)
-        
-        altitudes = [entry['altitude'] for entry in data['data']]
-        self.assertEqual(altitudes, sorted(altitudes))
+        def post(payload):
+            response = api.app.test_client().post(
+                '/telemetry',
+                data=orjson.dumps(payload),
+                content_type='application/json'
+            )
+            self.assertEqual(response.status_code, 201)
+            return response.get_json()['id']
 
-    def test_get_telemetry_sort_by_velocity(self):
-        """Test GET /telemetry sorting by velocity."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?sort_by=velocity&sort_order=desc&per_page=100')
-        data = json.loads(response.data)
-        
-        velocities = [entry['velocity'] for entry in data['data']]
-        self.assertEqual(velocities, sorted(velocities, reverse=True))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(post, payloads))
 
-    def test_get_telemetry_sort_by_satellite_id(self):
-        """Test GET /telemetry sorting by satelliteId."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?sort_by=satelliteId&sort_order=asc&per_page=100')
-        data = json.loads(response.data)
-        
-        sat_ids = [entry['satelliteId'] for entry in data['data']]
-        self.assertEqual(sat_ids, sorted(sat_ids))
+        self.assertEqual(sorted(ids), list(range(1, 9)))
 
-    def test_get_telemetry_sort_by_timestamp(self):
-        """Test GET /telemetry sorting by timestamp."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?sort_by=timestamp&sort_order=asc&per_page=100')
-        data = json.loads(response.data)
-        
-        timestamps = [entry['timestamp'] for entry in data['data']]
-        self.assertEqual(timestamps, sorted(timestamps))
+        response = self.client.get('/telemetry')
+        data = response.get_json()
+        self.assertEqual(data['pagination']['total'], 8)
 
-    def test_get_telemetry_sort_by_status(self):
-        """Test GET /telemetry sorting by status."""
+    # ===== POST /telemetry/bulk Tests =====
+
+    def test_post_telemetry_bulk_success(self):
+        """Test POST /telemetry/bulk inserts every entry and returns their ids."""
+        response = self.bulk_post(self.bulk_payload(3))
+
+        self.assertEqual(response.status_code, 201)
+        data = response.get_json()
+        self.assertEqual(data['ids'], [1, 2, 3])
+
+        response = self.client.get('/telemetry/3')
+        self.assertEqual(response.get_json()['satelliteId'], 'SAT002')
+
+    def test_post_telemetry_bulk_chunked(self):
+        """Test POST /telemetry/bulk returns contiguous ids across transaction chunks."""
+        with patch.object(api, 'BULK_CHUNK_SIZE', 2):
+            response = self.bulk_post(self.bulk_payload(5))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()['ids'], [1, 2, 3, 4, 5])
+
+        response = self.client.get('/telemetry?per_page=100')
+        self.assertEqual(response.get_json()['pagination']['total'], 5)
+
+    # ===== DELETE /telemetry/<id> Tests =====
+
+    def test_delete_telemetry_success(self):
+        """Test DELETE /telemetry/<id> with valid id."""
         self.insert_sample_data()
-        response = self.client.get('/telemetry?sort_by=status&sort_order=asc&per_page=100')
-        data = json.loads(response.data)
+        response = self.client.delete('/telemetry/1')
         
-        statuses = [entry['status'] for entry in data['data']]
-        self.assertEqual(statuses, sorted(statuses))
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['message'], 'Telemetry entry deleted')
 
-    def test_get_telemetry_invalid_sort_column(self):
-        """Test GET /telemetry with invalid sort column defaults to id."""
-        self.insert_sample_data()
-        response = self.client.get('/telemetry?sort_by=invalid_column&per_page=100')
-        data = json.loads(response.data)
+    def test_delete_telemetry_not_found(self):
+        """Test DELETE /telemetry/<id> with non-existent id."""
+        response = self.client.delete('/telemetry/999')
         
-        self.assertEqual(data['sorting']['sort_by'], 'id')
+        self.assertEqual(response.status_code, 404)
+        data = response.get_json()
+        self.assertIn('error', data)
+        self.assertEqual(data['error'], 'Telemetry entry not found')
 
-    def test_get_telemetry_invalid_sort_order(self):
-        """Test GET /telemetry with invalid sort order defaults to asc."""
+    def test_delete_telemetry_without_returning(self):
+        """Test DELETE /telemetry/<id> on SQLite without RETURNING support falls back to the row count."""
         self.insert_sample_data()
-        response = self.client.get('/telemetry?sort_order=invalid&per_page=100')
-        data = json.loads(response.data)
+        with patch.object(api, 'DELETE_RETURNING', False):
+            self.assertEqual(self.client.delete('/telemetry/1').status_code, 200)
+            self.assertEqual(self.client.delete('/telemetry/1').status_code, 404)
         
-        self.assertEqual(data['sorting']['sort_order'], 'asc')
+        self.assertEqual(self.client.get('/telemetry/1').status_code, 404)
 
-    def test_get_telemetry_response_structure(self):
-        """Test GET /telemetry response has correct structure."""
+    def test_delete_telemetry_removes_from_db(self):
+        """Test that DELETE /telemetry/<id> removes entry from database."""
         self.insert_sample_data()
-        response = self.client.get('/telemetry')
-        data = json.loads(response.data)
         
-        self.assertIn('data', data)
-        self.assertIn('pagination', data)
-        self.assertIn('sorting', data)
+        # Verify entry exists
+        response_before = self.client.get('/telemetry/1')
+        self.assertEqual(response_before.status_code, 200)
         
-        # Check pagination structure
-        self.assertIn('page', data['pagination'])
-        self.assertIn('per_page', data['pagination'])
-        self.assertIn('total', data['pagination'])
-        self.assertIn('total_pages', data['pagination'])
+        # Delete entry
+        response_delete = self.client.delete('/telemetry/1')
+        self.assertEqual(response_delete.status_code, 200)
         
-        # Check sorting structure
-        self.assertIn('sort_by', data['sorting'])
-        self.assertIn('sort_order', data['sorting'])
-
-    # ===== GET /telemetry/<id> Tests =====
+        # Verify entry is gone
+        response_after = self.client.get('/telemetry/1')
+        self.assertEqual(response_after.status_code, 404)
 
-    def test_get_telemetry_by_id_success(self):
-        """Test GET /telemetry/<id> with valid id."""
+    def test_delete_telemetry_multiple(self):
+        """Test deleting multiple different entries."""
         self.insert_sample_data()
-        response = self.client.get('/telemetry/1')
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
         
-        self.assertEqual(data['id'], 1)
-        self.assertEqual(data['satelliteId'], 'SAT001')
-
-    def test_get_telemetry_by_id_different_entries(self):
-        """Test GET /telemetry/<id> retrieves correct entry."""
-        self.insert_sample_data()
+        # Delete entry 1
+        response1 = self.client.delete('/telemetry/1')
+        self.assertEqual(response1.status_code, 200)
         
-        response1 = self.client.get('/telemetry/1')
-        data1 = json.loads(response1.data)
+        # Delete entry 3
+        response3 = self.client.delete('/telemetry/3')
+        self.assertEqual(response3.status_code, 200)
         
-        response2 = self.client.get('/telemetry/3')
-        data2 = json.loads(response2.data)
+        # Verify they're gone
+        self.assertEqual(self.client.get('/telemetry/1').status_code, 404)
+        self.assertEqual(self.client.get('/telemetry/3').status_code, 404)
         
-        self.assertNotEqual(data1['id'], data2['id'])
-        self.assertEqual(data1['satelliteId'], data2['satelliteId'])
+        # Verify others exist
+        self.assertEqual(self.client.get('/telemetry/2').status_code, 200)
 
-    def test_get_telemetry_by_id_not_found(self):
-        """Test GET /telemetry/<id> with non-existent id."""
-        response = self.client.get('/telemetry/999')
-        self.assertEqual(response.status_code, 404)
-        data = json.loads(response.data)
-        
-        self.assertIn('error', data)
-        self.assertEqual(data['error'], 'Telemetry entry not found')
+    def test_delete_telemetry_updates_total(self):
+        """Test that the unfiltered GET total drops after a DELETE."""
+        self.insert_sample_data()
+        self.client.delete('/telemetry/1')
 
-    def test_get_telemetry_by_id_empty_database(self):
-        """Test GET /telemetry/<id> on empty database."""
-        response = self.client.get('/telemetry/1')
+        response = self.client.get('/telemetry')
+        data = response.get_json()
+        self.assertEqual(data['pagination']['total'], 5)
+
+    def test_delete_telemetry_empty_database(self):
+        """Test DELETE /telemetry/<id> on empty database."""
+        response = self.client.delete('/telemetry/1')
         self.assertEqual(response.status_code, 404)
 
-    # ===== POST /telemetry Tests =====
+    # ===== Integration Tests =====
 
-    def test_post_telemetry_success(self):
-        """Test POST /telemetry with valid data."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
-        
-        self.assertEqual(response.status_code, 201)
-        data = json.loads(response.data)
-        self.assertIn('id', data)
-        self.assertEqual(data['message'], 'Telemetry entry added')
+    def test_full_workflow(self):
+        """Test complete workflow: POST, GET, GET by id, DELETE."""
+        # Requests reuse an app context that is already pushed, so the whole workflow shares one
+        # pooled connection instead of taking and returning one per request
+        with self.app.app_context():
+            # POST
+            post_response = self.client.post(
+                '/telemetry',
+                data=BASE_PAYLOAD_JSON,
+                content_type='application/json'
+            )
+            self.assertEqual(post_response.status_code, 201)
+            entry_id = post_response.get_json()['id']
+            
+            # GET all
+            get_all_response = self.client.get('/telemetry')
+            get_all_data = get_all_response.get_json()
+            self.assertEqual(len(get_all_data['data']), 1)
+            
+            # GET by id
+            get_by_id_response = self.client.get(f'/telemetry/{entry_id}')
+            self.assertEqual(get_by_id_response.status_code, 200)
+            
+            # DELETE
+            delete_response = self.client.delete(f'/telemetry/{entry_id}')
+            self.assertEqual(delete_response.status_code, 200)
+            
+            # Verify deleted
+            get_after_delete = self.client.get(f'/telemetry/{entry_id}')
+            self.assertEqual(get_after_delete.status_code, 404)
+            
+            self.assertEqual(util.get_pool(self.temp_db_path).stats()['active'], 1)
 
-    def test_post_telemetry_missing_satellite_id(self):
-        """Test POST /telemetry missing satelliteId."""
-        payload = {
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+    def test_multiple_entries_with_filters(self):
+        """Test operations with multiple entries and filters."""
+        # Seed the entries directly, the POST endpoints have their own tests
+        self.insert_rows([
+            (f'SAT{i:03d}', f'2025-12-10T{10+i:02d}:00:00Z', 400 + (i * 10), 7.8 + (i * 0.1), 'healthy' if i % 2 == 0 else 'critical')
+            for i in range(5)
+        ])
         
-        self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
-        self.assertIn('satelliteId', data['error'])
-
-    def test_post_telemetry_missing_timestamp(self):
-        """Test POST /telemetry missing timestamp."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'altitude': 400,
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        # Get all
+        response = self.client.get('/telemetry?per_page=100')
+        data = response.get_json()
+        self.assertEqual(data['pagination']['total'], 5)
         
-        self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
-        self.assertIn('timestamp', data['error'])
+        # Filter by status
+        response = self.client.get('/telemetry?status=healthy&per_page=100')
+        data = response.get_json()
+        self.assertEqual(len(data['data']), 3)
 
-    def test_post_telemetry_missing_altitude(self):
-        """Test POST /telemetry missing altitude."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
-        
-        self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
-        self.assertIn('altitude', data['error'])
 
-    def test_post_telemetry_missing_velocity(self):
-        """Test POST /telemetry missing velocity."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
-        
-        self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
-        self.assertIn('velocity', data['error'])
+class ValidationOnlyAPITestCase(APITestCase):
+    """
+    API tests for requests that are rejected before anything is written.
+    
+    The database is never touched, so these tests share the empty class database without resetting it between tests.
+    """
 
-    def test_post_telemetry_missing_status(self):
-        """Test POST /telemetry missing status."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'velocity': 7.8
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
-        
-        self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
-        self.assertIn('status', data['error'])
+    # ===== POST /telemetry Tests =====
+
+    def test_post_telemetry_missing_field(self):
+        """Test POST /telemetry rejects an entry missing any one required field, and names the field."""
+        for field in ('satelliteId', 'timestamp', 'altitude', 'velocity', 'status'):
+            with self.subTest(field=field):
+                payload = dict(BASE_PAYLOAD)
+                del payload[field]
+                response = self.post_json('/telemetry', payload)
+                
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.get_json()['error'], f'Missing required field: {field}')
 
     def test_post_telemetry_invalid_timestamp(self):
         """Test POST /telemetry with invalid timestamp."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': 'not-a-timestamp',
-            'altitude': 400,
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        payload = {**BASE_PAYLOAD, 'timestamp': 'not-a-timestamp'}
+        response = self.post_json('/telemetry', payload)
         
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('Invalid timestamp', data['error'])
 
     def test_post_telemetry_invalid_status(self):
         """Test POST /telemetry with invalid status."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'velocity': 7.8,
-            'status': 'unknown'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        payload = {**BASE_PAYLOAD, 'status': 'unknown'}
+        response = self.post_json('/telemetry', payload)
         
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('healthy', data['error'].lower())
 
+    def test_post_telemetry_invalid_satellite_id(self):
+        """Test POST /telemetry rejects a satelliteId that is not a non-empty string."""
+        for satellite_id in (None, ['SAT001'], 1, ''):
+            with self.subTest(satellite_id=satellite_id):
+                payload = {**BASE_PAYLOAD, 'satelliteId': satellite_id}
+                response = self.post_json('/telemetry', payload)
+                
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.get_json()['error'], 'satelliteId must be a non-empty string.')
+
+    def test_post_telemetry_non_finite_number(self):
+        """Test POST /telemetry rejects NaN and infinite altitude and velocity instead of storing or failing on them."""
+        for field in ('altitude', 'velocity'):
+            for value in ('nan', 'inf', '-inf'):
+                with self.subTest(field=field, value=value):
+                    payload = {**BASE_PAYLOAD, field: value}
+                    response = self.post_json('/telemetry', payload)
+                    
+                    self.assertEqual(response.status_code, 400)
+                    self.assertEqual(response.get_json()['error'], 'Altitude and velocity must be finite numbers.')
+        
+        response = self.client.get('/telemetry')
+        self.assertEqual(response.get_json()['pagination']['total'], 0)
+
     def test_post_telemetry_invalid_altitude_string(self):
         """Test POST /telemetry with altitude as string."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 'not-a-number',
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        payload = {**BASE_PAYLOAD, 'altitude': 'not-a-number'}
+        response = self.post_json('/telemetry', payload)
         
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('numeric', data['error'])
 
     def test_post_telemetry_invalid_velocity_string(self):
         """Test POST /telemetry with velocity as string."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'velocity': 'not-a-number',
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        payload = {**BASE_PAYLOAD, 'velocity': 'not-a-number'}
+        response = self.post_json('/telemetry', payload)
         
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('numeric', data['error'])
 
     def test_post_telemetry_negative_altitude(self):
         """Test POST /telemetry with negative altitude."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': -100,
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        payload = {**BASE_PAYLOAD, 'altitude': -100}
+        response = self.post_json('/telemetry', payload)
         
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('non-negative', data['error'])
 
     def test_post_telemetry_negative_velocity(self):
         """Test POST /telemetry with negative velocity."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'velocity': -7.8,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+        payload = {**BASE_PAYLOAD, 'velocity': -7.8}
+        response = self.post_json('/telemetry', payload)
         
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('non-negative', data['error'])
 
-    def test_post_telemetry_zero_altitude(self):
-        """Test POST /telemetry with zero altitude (valid)."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 0,
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
+    def test_post_telemetry_not_an_object(self):
+        """Test POST /telemetry with a JSON body that is not an object."""
+        response = self.post_json('/telemetry', ['SAT001'])
+
+        self.assertEqual(response.status_code, 400)
+        data = response.get_json()
+        self.assertIn('JSON object', data['error'])
+
+    # ===== POST /telemetry/bulk Tests =====
+
+    def test_post_telemetry_bulk_invalid_entry(self):
+        """Test POST /telemetry/bulk rejects the whole batch when one entry is invalid."""
+        payload = self.bulk_payload(3)
+        payload[1]['status'] = 'unknown'
+        response = self.bulk_post(payload)
+
+        self.assertEqual(response.status_code, 400)
+        data = response.get_json()
+        self.assertIn('Entry 1', data['error'])
+
+        response = self.client.get('/telemetry')
+        self.assertEqual(response.get_json()['pagination']['total'], 0)
+
+    def test_post_telemetry_bulk_invalid_satellite_id(self):
+        """Test POST /telemetry/bulk rejects a null or list satelliteId before any chunk is written."""
+        for satellite_id in (None, ['SAT001']):
+            with self.subTest(satellite_id=satellite_id):
+                payload = self.bulk_payload(3)
+                payload[2]['satelliteId'] = satellite_id
+                with patch.object(api, 'BULK_CHUNK_SIZE', 1):
+                    response = self.bulk_post(payload)
+
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('Entry 2', response.get_json()['error'])
+
+                response = self.client.get('/telemetry')
+                self.assertEqual(response.get_json()['pagination']['total'], 0)
+
+    def test_post_telemetry_bulk_non_finite_number(self):
+        """Test POST /telemetry/bulk rejects a NaN or infinite entry before any chunk is written."""
+        for field, value in (('altitude', 'nan'), ('velocity', 'nan'), ('altitude', 'inf')):
+            with self.subTest(field=field, value=value):
+                payload = self.bulk_payload(3)
+                payload[2][field] = value
+                with patch.object(api, 'BULK_CHUNK_SIZE', 1):
+                    response = self.bulk_post(payload)
+
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('Entry 2', response.get_json()['error'])
+
+                response = self.client.get('/telemetry')
+                self.assertEqual(response.get_json()['pagination']['total'], 0)
+
+    def test_post_telemetry_bulk_not_a_list(self):
+        """Test POST /telemetry/bulk with a single object instead of a list."""
+        response = self.bulk_post(self.bulk_payload(1)[0])
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_post_telemetry_invalid_json(self):
+        """Test POST /telemetry answers a malformed body with a JSON 400."""
         response = self.client.post(
             '/telemetry',
-            data=json.dumps(payload),
+            data=BASE_PAYLOAD_JSON[:-1],
             content_type='application/json'
         )
-        
-        self.assertEqual(response.status_code, 201)
 
-    def test_post_telemetry_zero_velocity(self):
-        """Test POST /telemetry with zero velocity (valid)."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'velocity': 0,
-            'status': 'healthy'
-        }
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Request body is not valid JSON.')
+
+    def test_post_telemetry_bulk_invalid_json(self):
+        """Test POST /telemetry/bulk answers a malformed body with a JSON 400."""
         response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
+            '/telemetry/bulk',
+            data=b'[{"satelliteId": ',
             content_type='application/json'
         )
-        
-        self.assertEqual(response.status_code, 201)
 
-    def test_post_telemetry_creates_entry_in_db(self):
-        """Test that POST /telemetry creates entry in database."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Request body is not valid JSON.')
+
+    def test_post_telemetry_bulk_not_json(self):
+        """Test POST /telemetry/bulk rejects a body that is not sent as JSON."""
         response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
+            '/telemetry/bulk',
+            data=orjson.dumps(self.bulk_payload(1)),
+            content_type='text/plain'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('application/json', response.get_json()['error'])
+
+    def test_post_telemetry_bulk_empty_list(self):
+        """Test POST /telemetry/bulk with an empty list."""
+        response = self.bulk_post([])
+
+        self.assertEqual(response.status_code, 400)
+
+
+class SampleDataAPITestCase(APITestCase):
+    """
+    Read-only API tests against the sample data.
+    
+    None of these tests write, so the sample rows are inserted once for the whole class instead of before every test.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the shared database and insert the sample data once."""
+        super().setUpClass()
+        cls.insert_sample_data()
+
+    # ===== Response format Tests =====
+
+    def test_json_response_content_type(self):
+        """Test that success and error responses are both served as JSON."""
+        self.assertEqual(self.client.get('/telemetry').mimetype, 'application/json')
+        self.assertEqual(self.client.get('/telemetry/999').mimetype, 'application/json')
+
+    def test_flask_json_uses_orjson(self):
+        """Test that Flask's own JSON support, request.get_json and jsonify, goes through orjson."""
+        with self.app.test_request_context(method='POST', data=b'{"altitude": 400.5}', content_type='application/json'):
+            self.assertEqual(api.request.get_json(), {'altitude': 400.5})
+
+            response = self.app.json.response({'id': 1})
+            self.assertEqual(response.data, b'{"id":1}')
+            self.assertEqual(response.mimetype, 'application/json')
+
+        # orjson writes datetimes as ISO 8601, the stdlib-based default provider would write an HTTP date
+        self.assertEqual(self.app.json.dumps({'t': datetime(2025, 12, 10, 10)}), '{"t":"2025-12-10T10:00:00"}')
+
+    def test_flask_json_sorts_keys(self):
+        """Test that the orjson provider sorts keys like Flask's default provider unless told not to."""
+        self.assertEqual(self.app.json.dumps({'b': 1, 'a': 2}), '{"a":2,"b":1}')
+        self.assertEqual(self.app.json.dumps({'b': 1, 'a': 2}, sort_keys=False), '{"b":1,"a":2}')
+
+        with self.app.app_context():
+            self.assertEqual(self.app.json.response(b=1, a=2).data, b'{"a":2,"b":1}')
+            with patch.object(self.app.json, 'sort_keys', False):
+                self.assertEqual(self.app.json.response(b=1, a=2).data, b'{"b":1,"a":2}')
+
+    def test_get_telemetry_columnar_matches_rows(self):
+        """Test that format=columnar returns the same page as one array per column."""
+        query = '/telemetry?status=healthy&sort_by=altitude&per_page=3'
+        rows = self.client.get(query).get_json()
+        columnar = self.client.get(query + '&format=columnar').get_json()
+
+        self.assertEqual(
+            columnar['data'],
+            {column: [row[column] for row in rows['data']] for column in api.TELEMETRY_COLUMNS}
         )
+        self.assertEqual(columnar['pagination'], rows['pagination'])
+
+    def test_get_telemetry_columnar_no_matches(self):
+        """Test that format=columnar still returns every column, empty, when nothing matches."""
+        response = self.client.get('/telemetry?satelliteId=NONEXISTENT&format=columnar')
+        data = response.get_json()
+
+        self.assertEqual(data['data'], {column: [] for column in api.TELEMETRY_COLUMNS})
+
+    # ===== GET /telemetry Tests =====
+
+    def test_get_telemetry_all_data(self):
+        """Test GET /telemetry returns all data."""
+        response = self.client.get('/telemetry?per_page=100')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
         
-        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(data['data']), 6)
+        self.assertEqual(data['pagination']['total'], 6)
+
+    def test_get_telemetry_trailing_slash(self):
+        """Test GET /telemetry/ is served directly instead of redirecting."""
+        response = self.client.get('/telemetry/?per_page=100')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+
+        self.assertEqual(len(data['data']), 6)
+
+    def test_get_telemetry_pagination_first_page(self):
+        """Test GET /telemetry pagination first page."""
+        response = self.client.get('/telemetry?page=1&per_page=2')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
         
-        # Verify entry exists
-        response_get = self.client.get('/telemetry/1')
-        self.assertEqual(response_get.status_code, 200)
-        data = json.loads(response_get.data)
-        self.assertEqual(data['satelliteId'], 'SAT001')
+        self.assertEqual(len(data['data']), 2)
+        self.assertEqual(data['pagination']['page'], 1)
+        self.assertEqual(data['pagination']['total_pages'], 3)
 
-    def test_post_telemetry_float_altitude(self):
-        """Test POST /telemetry with float altitude."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400.5,
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
+    def test_get_telemetry_pagination_second_page(self):
+        """Test GET /telemetry pagination second page."""
+        response = self.client.get('/telemetry?page=2&per_page=2')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
         
-        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(data['data']), 2)
+        self.assertEqual(data['pagination']['page'], 2)
 
-    def test_post_telemetry_float_velocity(self):
-        """Test POST /telemetry with float velocity."""
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'velocity': 7.8432,
-            'status': 'healthy'
-        }
-        response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
+    def test_get_telemetry_pagination_last_page(self):
+        """Test GET /telemetry pagination last page."""
+        response = self.client.get('/telemetry?page=3&per_page=2')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        
+        self.assertEqual(len(data['data']), 2)
+        self.assertEqual(data['pagination']['page'], 3)
+
+    def test_get_telemetry_invalid_page_zero(self):
+        """Test GET /telemetry with page=0 defaults to page 1."""
+        response = self.client.get('/telemetry?page=0&per_page=20')
+        data = response.get_json()
+        self.assertEqual(data['pagination']['page'], 1)
+
+    def test_get_telemetry_invalid_page_negative(self):
+        """Test GET /telemetry with negative page defaults to page 1."""
+        response = self.client.get('/telemetry?page=-5&per_page=20')
+        data = response.get_json()
+        self.assertEqual(data['pagination']['page'], 1)
+
+    def test_get_telemetry_per_page_cap(self):
+        """Test GET /telemetry caps per_page at 100."""
+        response = self.client.get('/telemetry?per_page=500')
+        data = response.get_json()
+        self.assertEqual(data['pagination']['per_page'], 100)
+
+    def test_get_telemetry_per_page_minimum(self):
+        """Test GET /telemetry enforces minimum per_page of 1."""
+        response = self.client.get('/telemetry?per_page=0')
+        data = response.get_json()
+        self.assertEqual(data['pagination']['per_page'], 1)
+
+    def test_get_telemetry_filter_by_satellite_id(self):
+        """Test GET /telemetry filtering by satelliteId."""
+        response = self.client.get('/telemetry?satelliteId=SAT001&per_page=100')
+        data = response.get_json()
+        
+        self.assertEqual(data['pagination']['total'], 3)
+        self.assertTrue(all(entry['satelliteId'] == 'SAT001' for entry in data['data']))
+
+    def test_get_telemetry_filter_by_status(self):
+        """Test GET /telemetry filtering by status."""
+        response = self.client.get('/telemetry?status=critical&per_page=100')
+        data = response.get_json()
+        
+        self.assertEqual(data['pagination']['total'], 2)
+        self.assertTrue(all(entry['status'] == 'critical' for entry in data['data']))
+
+    def test_get_telemetry_filter_by_both(self):
+        """Test GET /telemetry with both filters."""
+        response = self.client.get('/telemetry?satelliteId=SAT001&status=healthy&per_page=100')
+        data = response.get_json()
+        
+        self.assertEqual(data['pagination']['total'], 2)
+        self.assertTrue(all(entry['satelliteId'] == 'SAT001' for entry in data['data']))
+        self.assertTrue(all(entry['status'] == 'healthy' for entry in data['data']))
+
+    def test_get_telemetry_filter_rows_have_no_total(self):
+        """Test that filtered pages return only the telemetry columns in each row."""
+        response = self.client.get('/telemetry?status=healthy&per_page=2')
+        data = response.get_json()
+
+        self.assertEqual(data['pagination']['total'], 4)
+        self.assertEqual(
+            set(data['data'][0]),
+            {'id', 'satelliteId', 'timestamp', 'altitude', 'velocity', 'status'}
         )
+
+    def test_get_telemetry_filter_past_last_page(self):
+        """Test that a filtered page past the end still reports the total."""
+        response = self.client.get('/telemetry?satelliteId=SAT001&page=5&per_page=2')
+        data = response.get_json()
+
+        self.assertEqual(data['data'], [])
+        self.assertEqual(data['pagination']['total'], 3)
+        self.assertEqual(data['pagination']['total_pages'], 2)
+
+    def test_get_telemetry_filter_no_matches(self):
+        """Test GET /telemetry filter with no matches."""
+        response = self.client.get('/telemetry?satelliteId=NONEXISTENT&per_page=100')
+        data = response.get_json()
         
-        self.assertEqual(response.status_code, 201)
+        self.assertEqual(data['pagination']['total'], 0)
+        self.assertEqual(len(data['data']), 0)
 
-    # ===== DELETE /telemetry/<id> Tests =====
+    def test_get_telemetry_sort_by_id_asc(self):
+        """Test GET /telemetry sorting by id ascending."""
+        response = self.client.get('/telemetry?sort_by=id&sort_order=asc&per_page=100')
+        data = response.get_json()
+        
+        ids = [entry['id'] for entry in data['data']]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(data['sorting']['sort_by'], 'id')
+        self.assertEqual(data['sorting']['sort_order'], 'asc')
 
-    def test_delete_telemetry_success(self):
-        """Test DELETE /telemetry/<id> with valid id."""
-        self.insert_sample_data()
-        response = self.client.delete('/telemetry/1')
+    def test_get_telemetry_sort_by_id_desc(self):
+        """Test GET /telemetry sorting by id descending."""
+        response = self.client.get('/telemetry?sort_by=id&sort_order=desc&per_page=100')
+        data = response.get_json()
         
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
-        self.assertEqual(data['message'], 'Telemetry entry deleted')
+        ids = [entry['id'] for entry in data['data']]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+        self.assertEqual(data['sorting']['sort_order'], 'desc')
 
-    def test_delete_telemetry_not_found(self):
-        """Test DELETE /telemetry/<id> with non-existent id."""
-        response = self.client.delete('/telemetry/999')
+    def test_get_telemetry_sort_order_case_insensitive(self):
+        """Test GET /telemetry accepts an upper case sort_order and reports it normalized."""
+        response = self.client.get('/telemetry?sort_by=id&sort_order=DESC&per_page=100')
+        data = response.get_json()
         
-        self.assertEqual(response.status_code, 404)
-        data = json.loads(response.data)
-        self.assertIn('error', data)
-        self.assertEqual(data['error'], 'Telemetry entry not found')
+        ids = [entry['id'] for entry in data['data']]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+        self.assertEqual(data['sorting']['sort_order'], 'desc')
 
-    def test_delete_telemetry_removes_from_db(self):
-        """Test that DELETE /telemetry/<id> removes entry from database."""
-        self.insert_sample_data()
+    def test_get_telemetry_sort_by_altitude(self):
+        """Test GET /telemetry sorting by altitude."""
+        response = self.client.get('/telemetry?sort_by=altitude&sort_order=asc&per_page=100')
+        data = response.get_json()
         
-        # Verify entry exists
-        response_before = self.client.get('/telemetry/1')
-        self.assertEqual(response_before.status_code, 200)
+        altitudes = [entry['altitude'] for entry in data['data']]
+        self.assertEqual(altitudes, sorted(altitudes))
+
+    def test_get_telemetry_sort_by_velocity(self):
+        """Test GET /telemetry sorting by velocity."""
+        response = self.client.get('/telemetry?sort_by=velocity&sort_order=desc&per_page=100')
+        data = response.get_json()
         
-        # Delete entry
-        response_delete = self.client.delete('/telemetry/1')
-        self.assertEqual(response_delete.status_code, 200)
+        velocities = [entry['velocity'] for entry in data['data']]
+        self.assertEqual(velocities, sorted(velocities, reverse=True))
+
+    def test_get_telemetry_sort_by_satellite_id(self):
+        """Test GET /telemetry sorting by satelliteId."""
+        response = self.client.get('/telemetry?sort_by=satelliteId&sort_order=asc&per_page=100')
+        data = response.get_json()
         
-        # Verify entry is gone
-        response_after = self.client.get('/telemetry/1')
-        self.assertEqual(response_after.status_code, 404)
+        sat_ids = [entry['satelliteId'] for entry in data['data']]
+        self.assertEqual(sat_ids, sorted(sat_ids))
 
-    def test_delete_telemetry_multiple(self):
-        """Test deleting multiple different entries."""
-        self.insert_sample_data()
+    def test_get_telemetry_sort_by_timestamp(self):
+        """Test GET /telemetry sorting by timestamp."""
+        response = self.client.get('/telemetry?sort_by=timestamp&sort_order=asc&per_page=100')
+        data = response.get_json()
         
-        # Delete entry 1
-        response1 = self.client.delete('/telemetry/1')
-        self.assertEqual(response1.status_code, 200)
+        timestamps = [entry['timestamp'] for entry in data['data']]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+    def test_get_telemetry_sort_by_status(self):
+        """Test GET /telemetry sorting by status."""
+        response = self.client.get('/telemetry?sort_by=status&sort_order=asc&per_page=100')
+        data = response.get_json()
         
-        # Delete entry 3
-        response3 = self.client.delete('/telemetry/3')
-        self.assertEqual(response3.status_code, 200)
+        statuses = [entry['status'] for entry in data['data']]
+        self.assertEqual(statuses, sorted(statuses))
+
+    def test_get_telemetry_invalid_sort_column(self):
+        """Test GET /telemetry with invalid sort column defaults to id."""
+        response = self.client.get('/telemetry?sort_by=invalid_column&per_page=100')
+        data = response.get_json()
         
-        # Verify they're gone
-        self.assertEqual(self.client.get('/telemetry/1').status_code, 404)
-        self.assertEqual(self.client.get('/telemetry/3').status_code, 404)
+        self.assertEqual(data['sorting']['sort_by'], 'id')
+
+    def test_get_telemetry_invalid_sort_order(self):
+        """Test GET /telemetry with invalid sort order defaults to asc."""
+        response = self.client.get('/telemetry?sort_order=invalid&per_page=100')
+        data = response.get_json()
         
-        # Verify others exist
-        self.assertEqual(self.client.get('/telemetry/2').status_code, 200)
+        self.assertEqual(data['sorting']['sort_order'], 'asc')
 
-    def test_delete_telemetry_empty_database(self):
-        """Test DELETE /telemetry/<id> on empty database."""
-        response = self.client.delete('/telemetry/1')
-        self.assertEqual(response.status_code, 404)
+    def test_get_telemetry_keyset_by_id(self):
+        """Test GET /telemetry with after_id returns the rows after the cursor."""
+        response = self.client.get('/telemetry?per_page=2&after_id=2')
+        data = response.get_json()
 
-    # ===== Integration Tests =====
+        self.assertEqual([entry['id'] for entry in data['data']], [3, 4])
 
-    def test_full_workflow(self):
-        """Test complete workflow: POST, GET, GET by id, DELETE."""
-        # POST
-        payload = {
-            'satelliteId': 'SAT001',
-            'timestamp': '2025-12-10T10:00:00Z',
-            'altitude': 400,
-            'velocity': 7.8,
-            'status': 'healthy'
-        }
-        post_response = self.client.post(
-            '/telemetry',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
-        self.assertEqual(post_response.status_code, 201)
-        entry_id = json.loads(post_response.data)['id']
+    def test_get_telemetry_keyset_by_id_desc(self):
+        """Test GET /telemetry with after_id and descending order."""
+        response = self.client.get('/telemetry?per_page=2&sort_order=desc&after_id=5')
+        data = response.get_json()
+
+        self.assertEqual([entry['id'] for entry in data['data']], [4, 3])
+
+    def test_get_telemetry_keyset_walk_matches_full_sort(self):
+        """Test walking every page by cursor gives the same order as one big page."""
+        response = self.client.get('/telemetry?sort_by=altitude&sort_order=desc&per_page=100')
+        expected = [entry['id'] for entry in response.get_json()['data']]
+
+        seen = []
+        url = '/telemetry?sort_by=altitude&sort_order=desc&per_page=2'
+        response = self.client.get(url)
+        page = response.get_json()['data']
+        while page:
+            seen.extend(entry['id'] for entry in page)
+            last = page[-1]
+            response = self.client.get(f"{url}&after_id={last['id']}&after_value={last['altitude']}")
+            page = response.get_json()['data']
+
+        self.assertEqual(seen, expected)
+
+    def test_get_telemetry_keyset_total_ignores_cursor(self):
+        """Test that the cursor does not change the filtered total."""
+        response = self.client.get('/telemetry?satelliteId=SAT001&after_id=1')
+        data = response.get_json()
+
+        self.assertEqual(data['pagination']['total'], 3)
+        self.assertEqual(len(data['data']), 2)
+
+    def test_get_telemetry_keyset_non_integer_after_id(self):
+        """Test GET /telemetry with a non-integer after_id is rejected rather than ignored."""
+        response = self.client.get('/telemetry?after_id=abc')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'after_id must be an integer.')
+
+    def test_get_telemetry_keyset_missing_after_value(self):
+        """Test GET /telemetry with after_id but no after_value on a non-id sort."""
+        response = self.client.get('/telemetry?sort_by=timestamp&after_id=2')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('after_value', response.get_json()['error'])
+
+    def test_get_telemetry_keyset_non_numeric_after_value(self):
+        """Test GET /telemetry with a non-numeric after_value on a numeric sort."""
+        response = self.client.get('/telemetry?sort_by=altitude&after_id=2&after_value=high')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('numeric', response.get_json()['error'])
+
+    def test_get_telemetry_response_structure(self):
+        """Test GET /telemetry response has correct structure."""
+        response = self.client.get('/telemetry')
+        data = response.get_json()
         
-        # GET all
-        get_all_response = self.client.get('/telemetry')
-        get_all_data = json.loads(get_all_response.data)
-        self.assertEqual(len(get_all_data['data']), 1)
+        self.assertIn('data', data)
+        self.assertIn('pagination', data)
+        self.assertIn('sorting', data)
         
-        # GET by id
-        get_by_id_response = self.client.get(f'/telemetry/{entry_id}')
-        self.assertEqual(get_by_id_response.status_code, 200)
+        # Check pagination structure
+        self.assertIn('page', data['pagination'])
+        self.assertIn('per_page', data['pagination'])
+        self.assertIn('total', data['pagination'])
+        self.assertIn('total_pages', data['pagination'])
         
-        # DELETE
-        delete_response = self.client.delete(f'/telemetry/{entry_id}')
-        self.assertEqual(delete_response.status_code, 200)
+        # Check sorting structure
+        self.assertIn('sort_by', data['sorting'])
+        self.assertIn('sort_order', data['sorting'])
+
+    # ===== GET /telemetry/<id> Tests =====
+
+    def test_get_telemetry_by_id_success(self):
+        """Test GET /telemetry/<id> with valid id."""
+        response = self.client.get('/telemetry/1')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
         
-        # Verify deleted
-        get_after_delete = self.client.get(f'/telemetry/{entry_id}')
-        self.assertEqual(get_after_delete.status_code, 404)
+        self.assertEqual(data['id'], 1)
+        self.assertEqual(data['satelliteId'], 'SAT001')
 
-    def test_multiple_entries_with_filters(self):
-        """Test operations with multiple entries and filters."""
-        # Add multiple entries
-        for i in range(5):
-            payload = {
-                'satelliteId': f'SAT{i:03d}',
-                'timestamp': f'2025-12-10T{10+i:02d}:00:00Z',
-                'altitude': 400 + (i * 10),
-                'velocity': 7.8 + (i * 0.1),
-                'status': 'healthy' if i % 2 == 0 else 'critical'
-            }
-            response = self.client.post(
-                '/telemetry',
-                data=json.dumps(payload),
-                content_type='application/json'
-            )
-            self.assertEqual(response.status_code, 201)
+    def test_get_telemetry_by_id_full_entry(self):
+        """Test GET /telemetry/<id> returns every column with its stored value."""
+        response = self.client.get('/telemetry/4')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+
+        self.assertEqual(data, {
+            'id': 4,
+            'satelliteId': 'SAT002',
+            'timestamp': '2025-12-10T10:30:00Z',
+            'altitude': 500,
+            'velocity': 8.0,
+            'status': 'healthy'
+        })
+
+    def test_get_telemetry_by_id_different_entries(self):
+        """Test GET /telemetry/<id> retrieves correct entry."""
+        response1 = self.client.get('/telemetry/1')
+        data1 = response1.get_json()
         
-        # Get all
-        response = self.client.get('/telemetry?per_page=100')
-        data = json.loads(response.data)
-        self.assertEqual(data['pagination']['total'], 5)
+        response2 = self.client.get('/telemetry/3')
+        data2 = response2.get_json()
         
-        # Filter by status
-        response = self.client.get('/telemetry?status=healthy&per_page=100')
-        data = json.loads(response.data)
-        self.assertEqual(len(data['data']), 3)
+        self.assertNotEqual(data1['id'], data2['id'])
+        self.assertEqual(data1['satelliteId'], data2['satelliteId'])
+
+    # ===== Integration Tests =====
 
     def test_pagination_with_sorting(self):
         """Test pagination combined with sorting."""
-        self.insert_sample_data()
-        
         # Get first page sorted by altitude descending
         response = self.client.get('/telemetry?page=1&per_page=2&sort_by=altitude&sort_order=desc')
-        data = json.loads(response.data)
+        data = response.get_json()
         
         self.assertEqual(len(data['data']), 2)
         self.assertEqual(data['sorting']['sort_by'], 'altitude')
@@ -1,31 +1,326 @@
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+import atexit
+import contextlib
+import queue
 import sqlite3
+import threading
 
 
-def get_db(database):
-    """Get a database connection."""
-    db = sqlite3.connect(database)
+# Applied to every new connection.
+# WAL lets readers keep going while a POST is committing and only needs an fsync at checkpoint time,
+# so NORMAL sync is still safe against corruption. journal_mode is stored in the database file,
+# so setting it again on an existing WAL database is a cheap no-op.
+# cache_size is in KiB when negative, a 64 MiB page cache per connection that is only allocated as pages are read.
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+)
+
+# Size of each connection's prepared statement cache, large enough to hold every query the API issues
+CACHED_STATEMENTS = 256
+
+# Read back after an executemany to work out the ids it assigned, shared so it is one cached statement
+SQL_LAST_INSERT_ID = 'SELECT last_insert_rowid()'
+
+# Most rows the background writer folds into one transaction
+WRITE_BATCH_SIZE = 500
+
+# Seconds a POST waits for the writer thread to commit its row before giving up, so a stuck writer cannot hang requests
+WRITE_TIMEOUT = 30
+
+# Idle connections each pool keeps for reuse, enough for every thread of a gunicorn worker
+POOL_MAX_IDLE = 16
+
+
+def get_db(database, check_same_thread=True):
+    """
+    Get a database connection.
+    
+    The connection is in autocommit mode (`isolation_level=None`), so the sqlite3 module never opens
+    transactions on its own. Group writes with `transaction()` instead.
+    `database` can be a plain path or a `file:` URI, the tests use the latter for in-memory databases.
+    Pass `check_same_thread=False` for connections that are handed from thread to thread, like pooled ones.
+    """
+    db = sqlite3.connect(
+        database,
+        isolation_level=None,
+        cached_statements=CACHED_STATEMENTS,
+        uri=True,
+        check_same_thread=check_same_thread
+    )
     db.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        db.execute(pragma)
     return db
 
 
+class ConnectionPool:
+    """
+    Reuse open connections to one database instead of connecting on every request.
+    
+    A new connection costs an open, the WAL and shared-memory file setup and the tuning pragmas, and it starts with
+    an empty page cache and statement cache. Released connections go back on a LIFO stack so the most recently used,
+    warmest one is handed out next. When every connection is busy `acquire()` opens another rather than waiting,
+    and `release()` closes it again if the stack is already full.
+    """
+
+    def __init__(self, database, max_idle=POOL_MAX_IDLE):
+        self.database = database
+        self.idle = queue.LifoQueue(maxsize=max_idle)
+        self.active = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take an idle connection, or open a new one if there is none."""
+        try:
+            db = self.idle.get_nowait()
+        except queue.Empty:
+            db = get_db(self.database, check_same_thread=False)
+        with self.lock:
+            self.active += 1
+        return db
+
+    def release(self, db):
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self.lock:
+            self.active -= 1
+        # Never hand the next user a connection that is still inside someone else's transaction
+        if db.in_transaction:
+            db.execute('ROLLBACK')
+        try:
+            self.idle.put_nowait(db)
+        except queue.Full:
+            db.close()
+
+    def close(self):
+        """Close every idle connection."""
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def stats(self):
+        """Count the connections currently checked out and waiting in the pool."""
+        return {'active': self.active, 'idle': self.idle.qsize()}
+
+
+# One pool per database path, created on first use
+pools = {}
+pools_lock = threading.Lock()
+
+
+def get_pool(database):
+    """Get the connection pool for `database`, creating it the first time."""
+    pool = pools.get(database)
+    if pool is None:
+        with pools_lock:
+            pool = pools.setdefault(database, ConnectionPool(database))
+    return pool
+
+
+def close_pool(database):
+    """Close the idle connections to `database` and forget its pool."""
+    with pools_lock:
+        pool = pools.pop(database, None)
+    if pool is not None:
+        pool.close()
+
+
+@atexit.register
+def close_pools():
+    """Close every pooled connection, registered to run at interpreter exit."""
+    for database in list(pools):
+        close_pool(database)
+
+
+@contextlib.contextmanager
+def transaction(db):
+    """
+    Run a block of writes in one transaction, committing on success and rolling back on error.
+    
+    BEGIN IMMEDIATE takes the write lock up front. A deferred transaction starts out as a reader and has to
+    upgrade when it first writes, which can fail with SQLITE_BUSY when another connection got there first.
+    Waiting for the lock at BEGIN goes through the connection's busy timeout instead.
+    """
+    db.execute('BEGIN IMMEDIATE')
+    try:
+        yield db
+    except BaseException:
+        # SQLite rolls back on its own after some errors, like SQLITE_FULL, and a second ROLLBACK would raise
+        # over the original error
+        if db.in_transaction:
+            db.execute('ROLLBACK')
+        raise
+    db.execute('COMMIT')
+
+
+class BatchWriter:
+    """
+    Funnel single-row inserts from many request threads through one writer thread.
+    
+    `insert()` queues the row and blocks until it is committed. The writer thread takes every row that queued up
+    while the previous batch was committing and writes them with one `executemany` in one transaction,
+    so concurrent POSTs share a commit instead of each paying for their own. A lone request is written
+    straight away, there is no timer holding it back waiting for company.
+    """
+
+    def __init__(self, sql, max_batch=WRITE_BATCH_SIZE):
+        self.sql = sql
+        self.max_batch = max_batch
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def insert(self, database, row):
+        """
+        Insert `row` into `database` and return the new row id.
+        
+        On timeout the queued row is cancelled, so the writer skips it rather than committing a row whose request
+        already failed and may be retried. If the writer has already picked the row up, wait for that write instead.
+        """
+        future = Future()
+        self.queue.put((database, row, future))
+        if self.thread is None:
+            self.start()
+        try:
+            return future.result(timeout=WRITE_TIMEOUT)
+        except FutureTimeoutError:
+            if future.cancel():
+                raise
+            return future.result()
+
+    def start(self):
+        """Start the writer thread, on first use so a gunicorn worker starts its own after the fork."""
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='telemetry-writer', daemon=True)
+                self.thread.start()
+
+    def run(self):
+        """Wait for a row, then write it along with whatever else is already queued."""
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            self.write(batch)
+
+    def write(self, batch):
+        """
+        Write a batch of `(database, row, future)` items and resolve each future with its row id.
+        
+        If the batch fails, every row is retried in its own transaction, so a bad row only fails its own request
+        rather than every request that happened to share its batch.
+        """
+        by_database = {}
+        for item in batch:
+            # Skip rows whose request timed out and cancelled them, this also stops them being cancelled from now on
+            if item[2].set_running_or_notify_cancel():
+                by_database.setdefault(item[0], []).append(item)
+        
+        for database, items in by_database.items():
+            try:
+                last_id = self.write_rows(database, [row for _, row, _ in items])
+            except Exception as e:
+                if len(items) == 1:
+                    items[0][2].set_exception(e)
+                    continue
+                for _, row, future in items:
+                    try:
+                        future.set_result(self.write_rows(database, [row]))
+                    except Exception as row_error:
+                        future.set_exception(row_error)
+                continue
+            
+            # AUTOINCREMENT hands out sequential ids while this transaction holds the write lock
+            first_id = last_id - len(items) + 1
+            for offset, (_, _, future) in enumerate(items):
+                future.set_result(first_id + offset)
+
+    def write_rows(self, database, rows):
+        """Insert `rows` in one transaction on a pooled connection and return the id of the last one."""
+        pool = get_pool(database)
+        db = pool.acquire()
+        try:
+            with transaction(db):
+                db.executemany(self.sql, rows)
+                return db.execute(SQL_LAST_INSERT_ID).fetchone()[0]
+        finally:
+            pool.release(db)
+
+
+# Databases init_db has already set up in this process, so repeat calls skip the schema statements
+initialized = set()
+
+
 def init_db(database):
     """
     Initialize the database with the telemetry table.
     
     Assume that the database name or schema will never change for this exercise.
     In an actual production system, you would want to use a more robust system where it would not be instantiating itself.
+    Each database is only set up once per process. In-memory databases are always set up, since the same name
+    can refer to a brand new, empty database once the last connection to the old one closes.
     """
+    if database in initialized:
+        return
+    
     db = get_db(database)
-    cursor = db.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS telemetry (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            satelliteId TEXT NOT NULL,
-            timestamp TEXT NOT NULL,
-            altitude REAL NOT NULL,
-            velocity REAL NOT NULL,
-            status TEXT NOT NULL
-        )
-    ''')
-    db.commit()
-    db.close()
\ No newline at end of file
+    with transaction(db):
+        cursor = db.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS telemetry (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                satelliteId TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                altitude REAL NOT NULL,
+                velocity REAL NOT NULL,
+                status TEXT NOT NULL
+            )
+        ''')
+        # Indexes for the GET /telemetry filters so COUNT and paginated queries use range scans
+        # instead of walking the whole table. (satelliteId, status, id) also serves satelliteId-only filters.
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_sat_status_id ON telemetry (satelliteId, status, id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON telemetry (timestamp)')
+        # Every index ends in the rowid, so (altitude) is already ordered by (altitude, id) and pages sorted by
+        # altitude, with or without a status filter, are read in index order instead of sorted in a temp b-tree.
+        # SQLite walks an index backwards for DESC, so one ascending index serves both orders.
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_altitude ON telemetry (altitude)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_status_altitude ON telemetry (status, altitude)')
+        # (status, altitude) also serves status-only filters, so the older (status) index is only extra write work
+        cursor.execute('DROP INDEX IF EXISTS idx_status')
+        
+        # SQLite does not store row counts, so COUNT(*) has to scan. Keep a running total in `meta`
+        # that triggers update in the same transaction as every insert and delete.
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            INSERT OR IGNORE INTO meta (key, value)
+            SELECT 'telemetry_count', COUNT(*) FROM telemetry
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS telemetry_count_insert AFTER INSERT ON telemetry
+            BEGIN
+                UPDATE meta SET value = value + 1 WHERE key = 'telemetry_count';
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS telemetry_count_delete AFTER DELETE ON telemetry
+            BEGIN
+                UPDATE meta SET value = value - 1 WHERE key = 'telemetry_count';
+            END
+        ''')
+    db.close()
+    
+    if database != ':memory:' and 'mode=memory' not in database:
+        initialized.add(database)
\ No newline at end of file